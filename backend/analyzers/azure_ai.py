@@ -1,10 +1,20 @@
 import asyncio
 import io
 import base64
-from typing import Dict, Any, List, Optional
+import json
+import hashlib
+import tempfile
+import time
+from contextlib import nullcontext
+from collections import OrderedDict
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Callable, Awaitable, AsyncIterable, BinaryIO, Union
 import logging
 import sys
 import os
+import aiohttp
+from PIL import Image
 
 # Add parent directory to path to import azure_config
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,15 +22,39 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from azure.cognitiveservices.vision.computervision import ComputerVisionClient
     from azure.cognitiveservices.vision.computervision.models import OperationStatusCodes
-    from azure.ai.contentsafety import ContentSafetyClient
-    from azure.ai.contentsafety.models import AnalyzeTextOptions, AnalyzeImageOptions, TextCategory, ImageCategory
-    from azure.ai.textanalytics import TextAnalyticsClient
+    from azure.ai.textanalytics.aio import TextAnalyticsClient
     from azure.core.credentials import AzureKeyCredential
+    from azure.core.pipeline.transport import AioHttpTransport
     from msrest.authentication import CognitiveServicesCredentials
     AZURE_AVAILABLE = True
 except ImportError:
     AZURE_AVAILABLE = False
-    logging.warning("Azure SDK packages not installed. Install with: pip install azure-cognitiveservices-vision-computervision azure-ai-contentsafety azure-ai-textanalytics")
+    logging.warning("Azure SDK packages not installed. Install with: pip install azure-cognitiveservices-vision-computervision azure-ai-textanalytics")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from diskcache import Cache as DiskCache
+except ImportError:
+    DiskCache = None
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+try:
+    from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+except ImportError:
+    AsyncRetrying = None
 
 try:
     from azure_config import AzureConfig
@@ -33,6 +67,13 @@ except ImportError:
         CONTENT_SAFETY_KEY = None
         TEXT_ANALYTICS_ENDPOINT = None
         TEXT_ANALYTICS_KEY = None
+        CACHE_TTL = 3600
+        CACHE_MAX_ENTRIES = 1024
+        CACHE_DIR = None
+        CV_RPS = 10
+        CS_RPS = 10
+        TA_RPS = 10
+        MAX_CONCURRENCY = 8
         
         @classmethod
         def is_computer_vision_configured(cls) -> bool:
@@ -48,17 +89,298 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses Azure returns when a request was throttled or the service is briefly overloaded
+THROTTLED_STATUS_CODES = (429, 503)
+
+
+def _is_throttled(exc: BaseException) -> bool:
+    status = (
+        getattr(exc, "status_code", None)
+        or getattr(exc, "status", None)  # aiohttp.ClientResponseError
+        or getattr(getattr(exc, "response", None), "status_code", None)
+    )
+    return status in THROTTLED_STATUS_CODES
+
+
+# Cache key tags per endpoint. The API version is part of the tag so that moving to a
+# new Azure API version does not serve results cached from the old one.
+CV_CACHE_TAG = b"cv-3.2"
+CS_IMAGE_CACHE_TAG = b"cs-image-2023-10-01"
+CS_TEXT_CACHE_TAG = b"cs-text-2023-10-01"
+TA_CACHE_TAG = b"ta-3.1"
+DISK_CACHE_SIZE_LIMIT = 2 ** 30
+CACHE_DIGEST_SIZE = 16  # blake2b output bytes; ample for cache keying
+
+# Computer Vision features requested for every image
+CV_FEATURES = (
+    "adult",  # Adult/racy content detection
+    "brands", # Brand detection
+    "categories", # Image categorization
+    "description", # Image description
+    "faces", # Face detection
+    "objects", # Object detection
+    "tags"  # Image tags
+)
+
+
+def _pack_cv_result(analysis: Any) -> Dict[str, Any]:
+    """Flatten a Computer Vision ImageAnalysis into the result dict used by the analyzers"""
+    captions = analysis.description.captions if analysis.description else None
+    adult = analysis.adult
+    return {
+        "azure_analysis": "success",
+        "description": captions[0].text if captions else "No description",
+        "confidence": captions[0].confidence if captions else 0,
+        "tags": [{"name": tag.name, "confidence": tag.confidence} for tag in analysis.tags or ()],
+        "categories": [{"name": cat.name, "score": cat.score} for cat in analysis.categories or ()],
+        "adult_content": {
+            "is_adult": adult.is_adult_content,
+            "adult_score": adult.adult_score,
+            "is_racy": adult.is_racy_content,
+            "racy_score": adult.racy_score
+        } if adult else {},
+        "faces": len(analysis.faces or ()),
+        "objects": [{"name": obj.object_property, "confidence": obj.confidence} for obj in analysis.objects or ()],
+        "brands": [{"name": brand.name, "confidence": brand.confidence} for brand in analysis.brands or ()]
+    }
+
+
+# Content Safety is called over REST with a persistent session instead of through its SDK
+CONTENT_SAFETY_API_VERSION = "2023-10-01"
+CONTENT_SAFETY_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Content Safety severities at or above this are treated as rejected (high severity)
+SEVERITY_REJECT_THRESHOLD = 4
+
+
+def _json_dumps(payload: Dict[str, Any]) -> bytes:
+    return orjson.dumps(payload) if orjson else json.dumps(payload).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson else json.loads(body)
+
+
+if msgspec:
+    class _SafetyCategory(msgspec.Struct):
+        category: str
+        severity: Optional[int] = None
+    
+    class _SafetyResponse(msgspec.Struct, rename="camel"):
+        categories_analysis: List[_SafetyCategory] = []
+    
+    _safety_decoder = msgspec.json.Decoder(_SafetyResponse)
+
+
+def _decode_safety_categories(body: bytes) -> List[Tuple[str, int]]:
+    """Return (category, severity) pairs from a Content Safety response body"""
+    if msgspec:
+        # Typed decoding skips building the intermediate dicts for the whole response
+        return [(item.category, item.severity or 0) for item in _safety_decoder.decode(body).categories_analysis]
+    return [
+        (item["category"], item.get("severity") or 0)
+        for item in _json_loads(body).get("categoriesAnalysis", [])
+    ]
+
+
+# Text Analytics accepts up to 10 documents per request and bills per document,
+# so concurrent texts arriving within a short window share one request
+TA_BATCH_SIZE = 10
+TA_BATCH_WINDOW = 0.02
+
+# Azure rejects images over 4 MB and resamples large ones itself, so shrink before uploading
+MAX_IMAGE_BYTES = 3_800_000
+MAX_IMAGE_SIDE = 2048
+
+
+# Images passed as an async byte stream are spooled in memory up to this size, then to disk
+SPOOL_MAX_MEMORY = 4 * 1024 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+
+ImageSource = Union[bytes, BinaryIO, AsyncIterable[bytes]]
+
+
+def _is_buffer(image: Any) -> bool:
+    return isinstance(image, (bytes, bytearray, memoryview))
+
+
+async def _as_readable(image: ImageSource) -> Union[bytes, BinaryIO]:
+    """Return in-memory buffers and file objects as-is; spool async byte streams to a temp file"""
+    if _is_buffer(image) or hasattr(image, "read"):
+        return image
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    async for chunk in image:
+        spooled.write(chunk)
+    spooled.seek(0)
+    return spooled
+
+
+def _source_size(image: Union[bytes, BinaryIO]) -> int:
+    if _is_buffer(image):
+        return len(image)
+    size = image.seek(0, io.SEEK_END)
+    image.seek(0)
+    return size
+
+
+def _read_all(image: Union[bytes, BinaryIO]) -> bytes:
+    """Return the image's bytes, reading file objects from the start"""
+    if _is_buffer(image):
+        return image
+    image.seek(0)
+    return image.read()
+
+
+def _maybe_downscale(
+    image_data: Union[bytes, BinaryIO], max_bytes: int = MAX_IMAGE_BYTES, max_side: int = MAX_IMAGE_SIDE
+) -> Union[bytes, BinaryIO]:
+    """Return a JPEG no larger than max_side, or the original image if already small enough"""
+    try:
+        image = Image.open(io.BytesIO(image_data) if _is_buffer(image_data) else image_data)
+        if _source_size(image_data) <= max_bytes and max(image.size) <= max_side:
+            return image_data
+        
+        # draft() lets libjpeg decode at a reduced scale instead of decoding full size then resizing
+        image.draft("RGB", (max_side, max_side))
+        image.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        
+        output = io.BytesIO()
+        image.save(output, format="JPEG", quality=85)
+        return output.getvalue()
+    except Exception as e:
+        logger.warning("Could not downscale image for Azure, sending original: %s", e)
+        return image_data
+
+
+class _BufferReader:
+    """Read-only file object over an in-memory buffer that returns memoryview slices instead of copies"""
+    
+    def __init__(self, data: bytes):
+        self._view = memoryview(data)
+        self._pos = 0
+    
+    def read(self, size: int = -1) -> memoryview:
+        start = self._pos
+        end = len(self._view) if size is None or size < 0 else min(start + size, len(self._view))
+        self._pos = end
+        return self._view[start:end]
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, min(base + offset, len(self._view)))
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def __len__(self) -> int:
+        return len(self._view)
+
+
+def _upload_stream(image: Union[bytes, BinaryIO]) -> BinaryIO:
+    """Return a stream positioned at the start of the image, without copying in-memory buffers"""
+    if _is_buffer(image):
+        return _BufferReader(image)
+    image.seek(0)
+    return image
+
+
+# Shared read-only results returned when a service has no endpoint/key configured
+CV_NOT_CONFIGURED = MappingProxyType({"azure_analysis": "Azure Computer Vision not configured"})
+CS_NOT_CONFIGURED = MappingProxyType({"content_safety": "Azure Content Safety not configured"})
+TA_NOT_CONFIGURED = MappingProxyType({"azure_text_analysis": "Azure Text Analytics not configured"})
+
+
+async def _not_configured(result: MappingProxyType, *args: Any) -> MappingProxyType:
+    return result
+
+
+def _make_limiter(rate_per_second: float):
+    return AsyncLimiter(rate_per_second, 1) if AsyncLimiter else nullcontext()
+
+
+def _make_session() -> aiohttp.ClientSession:
+    """One pooled session shared by every async Azure client so TLS connections are reused"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=512, limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=75)
+    )
+
 
 class AzureAIServices:
     """Azure AI Services integration for enhanced analysis"""
     
     def __init__(self):
         self.computer_vision_client = None
-        self.content_safety_client = None
         self.text_analytics_client = None
         
-        if AZURE_AVAILABLE:
-            self._initialize_clients()
+        # Content Safety only needs its endpoint and key
+        self.content_safety_url = (
+            AzureConfig.CONTENT_SAFETY_ENDPOINT.rstrip("/") if AzureConfig.is_content_safety_configured() else None
+        )
+        self._cs_headers = {
+            "Ocp-Apim-Subscription-Key": AzureConfig.CONTENT_SAFETY_KEY or "",
+            "Content-Type": "application/json",
+        }
+        
+        # Shared HTTP transport, opened on first use inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # LRU of successful results: cache key -> (stored_at, result)
+        self._cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
+        # Optional disk-backed layer below the LRU that survives worker restarts
+        self._disk_cache = None
+        
+        # Per-service client-side rate limits so bursts queue here instead of triggering 429s
+        self._cv_limiter = _make_limiter(AzureConfig.CV_RPS)
+        self._cs_limiter = _make_limiter(AzureConfig.CS_RPS)
+        self._ta_limiter = _make_limiter(AzureConfig.TA_RPS)
+        
+        # Bounds in-flight Azure requests across all services
+        self._concurrency = asyncio.Semaphore(AzureConfig.MAX_CONCURRENCY)
+        
+        # Text Analytics micro-batching, started on first use inside the running event loop
+        self._ta_queue: Optional[asyncio.Queue] = None
+        self._ta_worker: Optional[asyncio.Task] = None
+        self._ta_batches: set = set()
+        
+        # SDK clients are built on first use rather than at import time
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
+        
+        if not self.content_safety_url:
+            self.check_content_safety_image = partial(_not_configured, CS_NOT_CONFIGURED)
+            self.check_content_safety_text = partial(_not_configured, CS_NOT_CONFIGURED)
+    
+    async def _ensure_initialized(self):
+        """Build the shared session and SDK clients once, the first time any analysis runs"""
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            self._session = _make_session()
+            if DiskCache and AzureConfig.CACHE_DIR:
+                self._disk_cache = await asyncio.to_thread(self._open_disk_cache)
+            if AZURE_AVAILABLE:
+                await asyncio.to_thread(self._initialize_clients)
+            
+            # Unconfigured services skip straight to a constant result on later calls
+            if not self.computer_vision_client:
+                self.analyze_image_with_azure = partial(_not_configured, CV_NOT_CONFIGURED)
+            if not self.text_analytics_client:
+                self.analyze_text_with_azure = partial(_not_configured, TA_NOT_CONFIGURED)
+            self._initialized = True
+    
+    @staticmethod
+    def _open_disk_cache():
+        try:
+            return DiskCache(AzureConfig.CACHE_DIR, size_limit=DISK_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            logger.warning("Azure disk cache unavailable at %s: %s", AzureConfig.CACHE_DIR, e)
+            return None
     
     def _initialize_clients(self):
         """Initialize Azure AI service clients"""
@@ -71,123 +393,251 @@ class AzureAIServices:
                 )
                 logger.info("Azure Computer Vision client initialized")
             
-            # Content Safety Client
-            if AzureConfig.is_content_safety_configured():
-                self.content_safety_client = ContentSafetyClient(
-                    AzureConfig.CONTENT_SAFETY_ENDPOINT,
-                    AzureKeyCredential(AzureConfig.CONTENT_SAFETY_KEY)
-                )
-                logger.info("Azure Content Safety client initialized")
-            
             # Text Analytics Client
             if AzureConfig.is_text_analytics_configured():
                 self.text_analytics_client = TextAnalyticsClient(
                     AzureConfig.TEXT_ANALYTICS_ENDPOINT,
-                    AzureKeyCredential(AzureConfig.TEXT_ANALYTICS_KEY)
+                    AzureKeyCredential(AzureConfig.TEXT_ANALYTICS_KEY),
+                    transport=AioHttpTransport(session=self._session, session_owner=False)
                 )
                 logger.info("Azure Text Analytics client initialized")
                 
         except Exception as e:
-            logger.error(f"Failed to initialize Azure clients: {e}")
+            logger.error("Failed to initialize Azure clients: %s", e)
+
+    async def aclose(self):
+        """Dispose the Azure clients and the shared connection pool"""
+        if self.text_analytics_client:
+            await self.text_analytics_client.close()
+            self.text_analytics_client = None
+        if self.computer_vision_client:
+            self.computer_vision_client.close()
+            self.computer_vision_client = None
+        if self._session and not self._session.closed:
+            await self._session.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+        self._initialized = False
+
+    async def _call_azure(self, limiter, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Send a request under the concurrency cap and service rate limit, retrying throttled calls with backoff"""
+        if AsyncRetrying is None:
+            async with self._concurrency, limiter:
+                return await request()
+        
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_is_throttled),
+            wait=wait_exponential_jitter(initial=0.5, max=8),
+            stop=stop_after_attempt(5),
+            reraise=True,
+        ):
+            with attempt:
+                async with self._concurrency, limiter:
+                    return await request()
     
-    async def analyze_image_with_azure(self, image_data: bytes) -> Dict[str, Any]:
-        """Enhanced image analysis using Azure Computer Vision"""
+    @staticmethod
+    def _cache_key(payload: Union[bytes, BinaryIO], tag: bytes) -> bytes:
+        if _is_buffer(payload):
+            return hashlib.blake2b(payload, digest_size=CACHE_DIGEST_SIZE).digest() + tag
+        
+        # Hash file objects chunk by chunk instead of reading them whole
+        digest = hashlib.blake2b(digest_size=CACHE_DIGEST_SIZE)
+        payload.seek(0)
+        for chunk in iter(lambda: payload.read(READ_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        payload.seek(0)
+        return digest.digest() + tag
+    
+    async def _cached(
+        self,
+        key: bytes,
+        status_key: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Return a cached result for key (memory, then disk), or compute and cache it if the call succeeded"""
+        entry = self._cache.get(key)
+        if entry is not None:
+            stored_at, result = entry
+            if time.monotonic() - stored_at < AzureConfig.CACHE_TTL:
+                self._cache.move_to_end(key)
+                return result
+            del self._cache[key]
+        
+        disk_cache = self._disk_cache
+        result = await asyncio.to_thread(disk_cache.get, key) if disk_cache is not None else None
+        if result is None:
+            result = await compute()
+            
+            # Errors are not cached so that transient failures are retried
+            if result.get(status_key) != "success":
+                return result
+            if disk_cache is not None:
+                await asyncio.to_thread(disk_cache.set, key, result, expire=AzureConfig.CACHE_TTL)
+        
+        self._remember(key, result)
+        return result
+    
+    def _remember(self, key: bytes, result: Dict[str, Any]):
+        self._cache[key] = (time.monotonic(), result)
+        if len(self._cache) > AzureConfig.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+    
+    async def analyze_image_with_azure(self, image_data: ImageSource) -> Dict[str, Any]:
+        """Enhanced image analysis using Azure Computer Vision
+        
+        Accepts raw bytes, a binary file object (e.g. an upload's SpooledTemporaryFile),
+        or an async iterable of byte chunks, so callers need not buffer the whole upload.
+        """
+        await self._ensure_initialized()
         if not self.computer_vision_client:
-            return {"azure_analysis": "Azure Computer Vision not configured"}
+            return CV_NOT_CONFIGURED
         
+        image_data = await _as_readable(image_data)
+        cache_key = await asyncio.to_thread(self._cache_key, image_data, CV_CACHE_TAG)
+        return await self._cached(
+            cache_key, "azure_analysis", lambda: self._analyze_image_with_azure(image_data)
+        )
+    
+    async def _analyze_image_with_azure(self, image_data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         try:
-            # Convert bytes to stream
-            image_stream = io.BytesIO(image_data)
-            
-            # Analyze image with Computer Vision
-            features = [
-                "adult",  # Adult/racy content detection
-                "brands", # Brand detection
-                "categories", # Image categorization
-                "description", # Image description
-                "faces", # Face detection
-                "objects", # Object detection
-                "tags"  # Image tags
-            ]
-            
-            analysis = self.computer_vision_client.analyze_image_in_stream(
-                image_stream, visual_features=features
-            )
+            image_data = await asyncio.to_thread(_maybe_downscale, image_data)
             
-            azure_results = {
-                "azure_analysis": "success",
-                "description": analysis.description.captions[0].text if analysis.description.captions else "No description",
-                "confidence": analysis.description.captions[0].confidence if analysis.description.captions else 0,
-                "tags": [{"name": tag.name, "confidence": tag.confidence} for tag in analysis.tags] if analysis.tags else [],
-                "categories": [{"name": cat.name, "score": cat.score} for cat in analysis.categories] if analysis.categories else [],
-                "adult_content": {
-                    "is_adult": analysis.adult.is_adult_content,
-                    "adult_score": analysis.adult.adult_score,
-                    "is_racy": analysis.adult.is_racy_content,
-                    "racy_score": analysis.adult.racy_score
-                } if analysis.adult else {},
-                "faces": len(analysis.faces) if analysis.faces else 0,
-                "objects": [{"name": obj.object_property, "confidence": obj.confidence} for obj in analysis.objects] if analysis.objects else [],
-                "brands": [{"name": brand.name, "confidence": brand.confidence} for brand in analysis.brands] if analysis.brands else []
-            }
+            # Computer Vision has no aio client; keep the blocking call off the event loop.
+            # A fresh reader is built per attempt since a retried request re-reads it.
+            analysis = await self._call_azure(self._cv_limiter, lambda: asyncio.to_thread(
+                self.computer_vision_client.analyze_image_in_stream,
+                _upload_stream(image_data), visual_features=CV_FEATURES
+            ))
             
-            return azure_results
+            return _pack_cv_result(analysis)
             
         except Exception as e:
-            logger.error(f"Azure Computer Vision analysis failed: {e}")
+            logger.error("Azure Computer Vision analysis failed: %s", e)
             return {"azure_analysis": f"Error: {str(e)}"}
     
-    async def check_content_safety_image(self, image_data: bytes) -> Dict[str, Any]:
-        """Check image for harmful content using Azure Content Safety"""
-        if not self.content_safety_client:
-            return {"content_safety": "Azure Content Safety not configured"}
+    async def _post_content_safety(self, operation: str, body: bytes) -> bytes:
+        url = f"{self.content_safety_url}/contentsafety/{operation}?api-version={CONTENT_SAFETY_API_VERSION}"
+        async with self._session.post(url, data=body, headers=self._cs_headers, timeout=CONTENT_SAFETY_TIMEOUT) as response:
+            response.raise_for_status()
+            return await response.read()
+    
+    @staticmethod
+    def _pack_safety_result(response: bytes) -> Dict[str, Any]:
+        return {
+            "content_safety": "success",
+            "categories": {
+                category: {
+                    "severity": severity,
+                    "rejected": severity >= SEVERITY_REJECT_THRESHOLD
+                }
+                for category, severity in _decode_safety_categories(response)
+            }
+        }
+    
+    async def check_content_safety_image(self, image_data: ImageSource) -> Dict[str, Any]:
+        """Check image for harmful content using Azure Content Safety
+
+        Accepts the same image sources as analyze_image_with_azure.
+        """
+        await self._ensure_initialized()
+        if not self.content_safety_url:
+            return CS_NOT_CONFIGURED
         
+        image_data = await _as_readable(image_data)
+        cache_key = await asyncio.to_thread(self._cache_key, image_data, CS_IMAGE_CACHE_TAG)
+        return await self._cached(
+            cache_key, "content_safety", lambda: self._check_content_safety_image(image_data)
+        )
+    
+    async def _check_content_safety_image(self, image_data: Union[bytes, BinaryIO]) -> Dict[str, Any]:
         try:
-            # Convert image to base64
-            image_b64 = base64.b64encode(image_data).decode('utf-8')
+            # The request embeds the image as base64, so file objects are read whole here
+            image_data = await asyncio.to_thread(lambda: _read_all(_maybe_downscale(image_data)))
             
-            # Analyze image safety
-            request = AnalyzeImageOptions(image={"content": image_b64})
-            response = self.content_safety_client.analyze_image(request)
+            # Base64 output is JSON-safe, so splice it into the body without a str round-trip
+            body = b'{"image":{"content":"' + base64.b64encode(image_data) + b'"}}'
+            response = await self._call_azure(
+                self._cs_limiter, lambda: self._post_content_safety("image:analyze", body)
+            )
             
-            safety_results = {
-                "content_safety": "success",
-                "categories": {}
-            }
+            return self._pack_safety_result(response)
             
-            # Process safety categories
-            for category_result in response.categories_analysis:
-                category_name = category_result.category.value if hasattr(category_result.category, 'value') else str(category_result.category)
-                safety_results["categories"][category_name] = {
-                    "severity": category_result.severity,
-                    "rejected": category_result.severity >= 4  # High severity threshold
-                }
+        except Exception as e:
+            logger.error("Azure Content Safety analysis failed: %s", e)
+            return {"content_safety": f"Error: {str(e)}"}
+    
+    @staticmethod
+    def _document_at(response: Any, index: int) -> Optional[Any]:
+        """Return one document of a Text Analytics batch response, or None if the call failed"""
+        if isinstance(response, Exception):
+            return None
+        if index >= len(response) or response[index].is_error:
+            return None
+        return response[index]
+    
+    async def _submit_text(self, text: str) -> Tuple[Any, Any, Any]:
+        """Queue text for the next Text Analytics batch and wait for its document results"""
+        if self._ta_worker is None or self._ta_worker.done():
+            self._ta_queue = asyncio.Queue()
+            self._ta_worker = asyncio.create_task(self._collect_text_batches())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._ta_queue.put((text, future))
+        return await future
+    
+    async def _collect_text_batches(self):
+        """Coalesce texts queued within TA_BATCH_WINDOW into requests of up to TA_BATCH_SIZE documents"""
+        queue = self._ta_queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(TA_BATCH_WINDOW)
+            while len(batch) < TA_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
             
-            return safety_results
+            # Send without blocking collection of the next batch
+            task = asyncio.create_task(self._analyze_text_batch(batch))
+            self._ta_batches.add(task)
+            task.add_done_callback(self._ta_batches.discard)
+    
+    async def _analyze_text_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        client = self.text_analytics_client
+        documents = [text for text, _ in batch]
+        
+        try:
+            # Sentiment, key phrases and entities are independent requests, so overlap them.
+            # A failing request only blanks its own section of the result.
+            responses = await asyncio.gather(
+                self._call_azure(self._ta_limiter, lambda: client.analyze_sentiment(documents)),
+                self._call_azure(self._ta_limiter, lambda: client.extract_key_phrases(documents)),
+                self._call_azure(self._ta_limiter, lambda: client.recognize_entities(documents)),
+                return_exceptions=True
+            )
+            for response in responses:
+                if isinstance(response, Exception):
+                    logger.warning("Azure Text Analytics request failed: %s", response)
             
+            for index, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(tuple(self._document_at(response, index) for response in responses))
         except Exception as e:
-            logger.error(f"Azure Content Safety analysis failed: {e}")
-            return {"content_safety": f"Error: {str(e)}"}
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
     
     async def analyze_text_with_azure(self, text: str) -> Dict[str, Any]:
         """Enhanced text analysis using Azure Text Analytics"""
+        await self._ensure_initialized()
         if not self.text_analytics_client:
-            return {"azure_text_analysis": "Azure Text Analytics not configured"}
+            return TA_NOT_CONFIGURED
         
+        return await self._cached(
+            self._cache_key(text.encode("utf-8"), TA_CACHE_TAG), "azure_text_analysis", lambda: self._analyze_text_with_azure(text)
+        )
+    
+    async def _analyze_text_with_azure(self, text: str) -> Dict[str, Any]:
         try:
-            documents = [text]
-            
-            # Sentiment Analysis
-            sentiment_response = self.text_analytics_client.analyze_sentiment(documents)
-            sentiment_result = sentiment_response[0] if sentiment_response else None
-            
-            # Key Phrase Extraction
-            key_phrases_response = self.text_analytics_client.extract_key_phrases(documents)
-            key_phrases_result = key_phrases_response[0] if key_phrases_response else None
-            
-            # Entity Recognition
-            entities_response = self.text_analytics_client.recognize_entities(documents)
-            entities_result = entities_response[0] if entities_response else None
+            sentiment_result, key_phrases_result, entities_result = await self._submit_text(text)
             
             azure_results = {
                 "azure_text_analysis": "success",
@@ -212,37 +662,68 @@ class AzureAIServices:
             return azure_results
             
         except Exception as e:
-            logger.error(f"Azure Text Analytics failed: {e}")
+            logger.error("Azure Text Analytics failed: %s", e)
             return {"azure_text_analysis": f"Error: {str(e)}"}
     
     async def check_content_safety_text(self, text: str) -> Dict[str, Any]:
         """Check text for harmful content using Azure Content Safety"""
-        if not self.content_safety_client:
-            return {"content_safety": "Azure Content Safety not configured"}
+        await self._ensure_initialized()
+        if not self.content_safety_url:
+            return CS_NOT_CONFIGURED
         
+        return await self._cached(
+            self._cache_key(text.encode("utf-8"), CS_TEXT_CACHE_TAG), "content_safety", lambda: self._check_content_safety_text(text)
+        )
+    
+    async def _check_content_safety_text(self, text: str) -> Dict[str, Any]:
         try:
             # Analyze text safety
-            request = AnalyzeTextOptions(text=text)
-            response = self.content_safety_client.analyze_text(request)
-            
-            safety_results = {
-                "content_safety": "success",
-                "categories": {}
-            }
-            
-            # Process safety categories
-            for category_result in response.categories_analysis:
-                category_name = category_result.category.value if hasattr(category_result.category, 'value') else str(category_result.category)
-                safety_results["categories"][category_name] = {
-                    "severity": category_result.severity,
-                    "rejected": category_result.severity >= 4  # High severity threshold
-                }
+            body = _json_dumps({"text": text})
+            response = await self._call_azure(
+                self._cs_limiter, lambda: self._post_content_safety("text:analyze", body)
+            )
             
-            return safety_results
+            return self._pack_safety_result(response)
             
         except Exception as e:
-            logger.error(f"Azure Content Safety text analysis failed: {e}")
+            logger.error("Azure Content Safety text analysis failed: %s", e)
             return {"content_safety": f"Error: {str(e)}"}
+    
+    async def analyze_image_all(self, image_data: ImageSource) -> Dict[str, Any]:
+        """Run Computer Vision and Content Safety on an image concurrently"""
+        # Both services read the image from worker threads at once; a shared file
+        # position would interleave their reads, so they get the bytes instead
+        image_data = await _as_readable(image_data)
+        if not _is_buffer(image_data):
+            image_data = await asyncio.to_thread(_read_all, image_data)
+        
+        computer_vision, content_safety = await asyncio.gather(
+            self.analyze_image_with_azure(image_data),
+            self.check_content_safety_image(image_data),
+            return_exceptions=True
+        )
+        return {
+            "computer_vision": self._as_result(computer_vision, "azure_analysis"),
+            "content_safety": self._as_result(content_safety, "content_safety"),
+        }
+    
+    async def analyze_text_all(self, text: str) -> Dict[str, Any]:
+        """Run Text Analytics and Content Safety on a text concurrently"""
+        text_analytics, content_safety = await asyncio.gather(
+            self.analyze_text_with_azure(text),
+            self.check_content_safety_text(text),
+            return_exceptions=True
+        )
+        return {
+            "text_analytics": self._as_result(text_analytics, "azure_text_analysis"),
+            "content_safety": self._as_result(content_safety, "content_safety"),
+        }
+    
+    @staticmethod
+    def _as_result(result: Any, status_key: str) -> Mapping[str, Any]:
+        if isinstance(result, Exception):
+            return {status_key: f"Error: {str(result)}"}
+        return result
 
 # Global instance
 azure_ai = AzureAIServices()
\ No newline at end of file
@@ -0,0 +1,98 @@
+import logging
+import re
+import threading
+from typing import Dict, List, Set
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordMatcher:
+    """Counts, per label, how many distinct keywords occur as substrings of a text."""
+    
+    def __init__(self, groups: Dict[str, List[str]]):
+        self.groups = groups
+        
+        # Every distinct keyword, sorted; found_ids reports positions in this tuple
+        self.words = tuple(sorted({word for words in groups.values() for word in words}))
+        
+        # Hyperscan compiles every keyword into one SIMD DFA; each pattern reports at
+        # most once per scan. Scratch space cannot be shared by concurrent scans, so
+        # every thread allocates its own on first use.
+        self._database = None
+        self._scratch = threading.local()
+        if hyperscan is not None:
+            try:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[re.escape(word).encode('utf-8') for word in self.words],
+                    ids=list(range(len(self.words))),
+                    flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self.words),
+                )
+                self._database = database
+            except Exception as e:
+                logger.warning("Hyperscan unavailable for keyword set, using Aho-Corasick: %s", e)
+        
+        # Otherwise Aho-Corasick finds every keyword of every label in one linear pass
+        self._automaton = None
+        if self._database is None and ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for word_id, word in enumerate(self.words):
+                automaton.add_word(word, word_id)
+            automaton.make_automaton()
+            self._automaton = automaton
+        
+        # Keywords as ASCII-lowered UTF-8 for the bytes API, folded like bytes.lower()
+        self._byte_needles = tuple((word, word.encode('utf-8').lower()) for word in self.words)
+    
+    def _scan(self, text: str) -> Set[int]:
+        scratch = getattr(self._scratch, 'scratch', None)
+        if scratch is None:
+            scratch = self._scratch.scratch = hyperscan.Scratch(self._database)
+        matched = set()
+        self._database.scan(
+            text.encode('utf-8'),
+            match_event_handler=lambda word_id, start, end, flags, context: matched.add(word_id),
+            scratch=scratch,
+        )
+        return matched
+    
+    def found_ids(self, text: str) -> Set[int]:
+        """Return the positions in words of the distinct keywords that occur in text."""
+        if self._database is not None:
+            return self._scan(text)
+        if self._automaton is None:
+            return {word_id for word_id, word in enumerate(self.words) if word in text}
+        return {word_id for _, word_id in self._automaton.iter(text)}
+    
+    def found(self, text: str) -> Set[str]:
+        """Return the distinct keywords that occur in text."""
+        words = self.words
+        return {words[word_id] for word_id in self.found_ids(text)}
+    
+    def found_bytes(self, data: bytes) -> Set[str]:
+        """Return the distinct keywords that occur in data, ignoring ASCII case, without decoding it."""
+        # Each keyword is its own substring test on the lowered bytes, so overlapping
+        # keywords and keywords that prefix one another are all reported, as in found()
+        data = data.lower()
+        return {word for word, needle in self._byte_needles if needle in data}
+    
+    def _count_found(self, found: Set[str]) -> Dict[str, int]:
+        return {label: sum(1 for word in words if word in found) for label, words in self.groups.items()}
+    
+    def count(self, text: str) -> Dict[str, int]:
+        """Map each label to the number of its keywords found in text."""
+        return self._count_found(self.found(text))
+    
+    def count_bytes(self, data: bytes) -> Dict[str, int]:
+        """Like count, over raw ASCII-compatible bytes matched case-insensitively."""
+        return self._count_found(self.found_bytes(data))
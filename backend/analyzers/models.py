@@ -1,54 +1,85 @@
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 
+# Slotted result types (no per-instance __dict__). FastAPI serializes them
+# directly; field names are the JSON keys the frontend reads.
+@dataclass(slots=True)
+class ImageAnalysis:
+    metadata: List[Dict[str, str]]
+    compression: List[Dict[str, str]]
+    artifacts: List[str]
+
+
+@dataclass(slots=True)
+class ImageResult:
+    trustScore: int
+    verdict: str
+    analysis: ImageAnalysis
+
+
+@dataclass(slots=True)
+class InfoItem:
+    """One labelled row of the URL report's domain and SSL tables."""
+    name: str
+    value: Any
+
+
+@dataclass(slots=True)
+class UrlResult:
+    trustScore: int
+    verdict: str
+    domainInfo: List[InfoItem]
+    sslInfo: List[InfoItem]
+    backlinkProfile: Dict[str, int]
+    privacyInfo: Optional[Dict[str, Any]] = None
+    securityHeaders: Optional[Dict[str, Any]] = None
+    dnsSecurity: Optional[Dict[str, Any]] = None
+    trackingInfo: Optional[Dict[str, Any]] = None
+
+
+@dataclass(slots=True)
+class TextResult:
+    trustScore: int
+    verdict: str
+    summary: str
+    sentiment: str
+    sources: List[Dict[str, Any]]
+
+
 def make_image_result(
     trust: int,
     verdict: str,
     metadata: List[Dict[str, str]],
     compression: List[Dict[str, str]],
     artifacts: List[str],
-) -> Dict[str, Any]:
-    return {
-        "trustScore": trust,
-        "verdict": verdict,
-        "analysis": {
-            "metadata": metadata,
-            "compression": compression,
-            "artifacts": artifacts,
-        },
-    }
+) -> ImageResult:
+    return ImageResult(trust, verdict, ImageAnalysis(metadata, compression, artifacts))
 
 
 def make_url_result(
     trust: int,
     verdict: str,
-    domain_info: List[Dict[str, Any]],
-    ssl_info: List[Dict[str, str]],
+    domain_info: List[InfoItem],
+    ssl_info: List[InfoItem],
     backlink_profile: Dict[str, int],
     privacy_info: Optional[Dict[str, Any]] = None,
     security_headers: Optional[Dict[str, Any]] = None,
     dns_security: Optional[Dict[str, Any]] = None,
     tracking_info: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
-    result = {
-        "trustScore": trust,
-        "verdict": verdict,
-        "domainInfo": domain_info,
-        "sslInfo": ssl_info,
-        "backlinkProfile": backlink_profile,
-    }
-    
-    # Add advanced security analysis if available
-    if privacy_info:
-        result["privacyInfo"] = privacy_info
-    if security_headers:
-        result["securityHeaders"] = security_headers
-    if dns_security:
-        result["dnsSecurity"] = dns_security
-    if tracking_info:
-        result["trackingInfo"] = tracking_info
-    
-    return result
+) -> UrlResult:
+    # Sections whose analysis produced nothing are sent as null
+    return UrlResult(
+        trust,
+        verdict,
+        domain_info,
+        ssl_info,
+        backlink_profile,
+        privacy_info or None,
+        security_headers or None,
+        dns_security or None,
+        tracking_info or None,
+    )
 
 
 def make_text_result(
@@ -57,11 +88,5 @@ def make_text_result(
     summary: str,
     sentiment: str,
     sources: List[Dict[str, Any]],
-) -> Dict[str, Any]:
-    return {
-        "trustScore": trust,
-        "verdict": verdict,
-        "summary": summary,
-        "sentiment": sentiment,
-        "sources": sources,
-    }
\ No newline at end of file
+) -> TextResult:
+    return TextResult(trust, verdict, summary, sentiment, sources)
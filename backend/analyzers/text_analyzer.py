@@ -1,27 +1,42 @@
 import asyncio
+import hashlib
+import logging
+import os
 import re
-import json
-from typing import Dict, Any, List, Tuple, Optional
-from collections import Counter
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Set, Tuple, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
 import nltk
-from textblob import TextBlob
-import requests
-from bs4 import BeautifulSoup
-import spacy
+from textblob.en import spelling as spelling_vocabulary
 import yake
 from langdetect import detect, LangDetectException
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import textstat
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-from sentence_transformers import SentenceTransformer
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import newspaper
-from goose3 import Goose
-from .models import make_text_result
+from .models import make_text_result, TextResult
+from .keywords import KeywordMatcher
 from .azure_ai import azure_ai
 
+# spaCy, transformers and sentence-transformers are imported when the models load
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import hyperscan
+    # Single match per pattern, case-insensitive, Unicode-aware \w and \b like Python's re
+    HYPERSCAN_FLAGS = (
+        hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    )
+except ImportError:
+    hyperscan = None
+
 
 # Download required NLTK data
 try:
@@ -40,19 +55,365 @@ except LookupError:
     nltk.download('averaged_perceptron_tagger')
 
 
+logger = logging.getLogger(__name__)
+
+# Worker threads for the synchronous analyses, keeping them off the event loop
+_cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="text-analysis")
+
+WORD_PATTERN = re.compile(r"[a-z]+")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+# Sentence boundary: whitespace after . ! or ? that precedes a capital, digit or quote,
+# unless the period ends a common abbreviation. Decimals and "U.S. troops" stay whole.
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r"(?<!\bDr\.)(?<!\bMr\.)(?<!\bMs\.)(?<!\bMrs\.)(?<!\bSt\.)(?<!\bvs\.)(?<!\bNo\.)"
+    r"(?<=[.!?])\s+(?=[A-Z0-9\"'])"
+)
+# Readability primitives: textstat's sentence rule and a vowel-group syllable estimate
+READABILITY_SENTENCE_PATTERN = re.compile(r"\b[^.!?]+[.!?]*")
+VOWEL_GROUP_PATTERN = re.compile(r"[aeiouy]+")
+
+
+@dataclass(slots=True)
+class TextView:
+    """The forms of one input text that the analyses share, each computed once."""
+    raw: str
+    lower: str
+    words: List[str]
+    word_set: Set[str]
+    sentences: List[str]
+    normalized: str
+
+
+def make_text_view(text: str) -> TextView:
+    lower = text.lower()
+    words = lower.split()
+    return TextView(
+        raw=text,
+        lower=lower,
+        words=words,
+        word_set=set(words),
+        sentences=SENTENCE_BOUNDARY_PATTERN.split(text.strip()),
+        normalized=PUNCTUATION_PATTERN.sub('', lower.strip()),
+    )
+
+
+@lru_cache(maxsize=65536)
+def _syllable_count(word: str) -> int:
+    """Estimate the syllables in a lowercase word from its vowel groups."""
+    count = len(VOWEL_GROUP_PATTERN.findall(word))
+    if count > 1 and word.endswith('e') and not word.endswith(('le', 'ee')):
+        count -= 1  # silent final e
+    return max(1, count)
+
+
+def _text_stats(view: TextView) -> Tuple[int, int, int, int, int]:
+    """Count characters, words, sentences, syllables and complex (3+ syllable) words in one pass."""
+    n_chars = sum(len(token) for token in view.words)
+    n_words = n_syllables = n_complex = 0
+    for token in view.words:
+        word = PUNCTUATION_PATTERN.sub('', token)
+        if not word:
+            continue
+        syllables = _syllable_count(word)
+        n_words += 1
+        n_syllables += syllables
+        if syllables >= 3:
+            n_complex += 1
+    
+    # Fragments of two words or fewer do not count as sentences
+    sentences = READABILITY_SENTENCE_PATTERN.findall(view.raw)
+    n_sentences = sum(1 for sentence in sentences if len(sentence.split()) > 2)
+    if view.raw:
+        n_sentences = max(1, n_sentences)
+    return n_chars, n_words, n_sentences, n_syllables, n_complex
+
+
+def _sentence_token_ids(sentences: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode each sentence's distinct lowercased words as sorted integer IDs.
+
+    Returns the IDs of all sentences concatenated, plus offsets such that
+    sentence k owns ids[offsets[k]:offsets[k + 1]].
+    """
+    vocab: Dict[str, int] = {}
+    ids: List[int] = []
+    offsets = [0]
+    for sentence in sentences:
+        ids.extend(sorted({vocab.setdefault(word, len(vocab)) for word in sentence.lower().split()}))
+        offsets.append(len(ids))
+    return np.array(ids, dtype=np.int32), np.array(offsets, dtype=np.int64)
+
+
+def _adjacent_jaccard_numpy(ids: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Jaccard similarity of each pair of neighbouring sentences, -1 where either is empty."""
+    similarities = np.full(max(len(offsets) - 2, 0), -1.0)
+    for k in range(len(similarities)):
+        a = ids[offsets[k]:offsets[k + 1]]
+        b = ids[offsets[k + 1]:offsets[k + 2]]
+        if len(a) and len(b):
+            common = len(np.intersect1d(a, b, assume_unique=True))
+            similarities[k] = common / (len(a) + len(b) - common)
+    return similarities
+
+
+# With numba, the kernel is compiled eagerly at import time and cached on disk
+if numba is not None:
+    @numba.njit("float64[::1](int32[::1], int64[::1])", cache=True)
+    def _adjacent_jaccard_kernel(ids, offsets):
+        pairs = max(offsets.shape[0] - 2, 0)
+        similarities = np.full(pairs, -1.0)
+        
+        for k in range(pairs):
+            a_start, a_end = offsets[k], offsets[k + 1]
+            b_start, b_end = offsets[k + 1], offsets[k + 2]
+            if a_start == a_end or b_start == b_end:
+                continue
+            
+            # Both ID runs are sorted, so a two-pointer merge counts the overlap
+            i, j, common = a_start, b_start, 0
+            while i < a_end and j < b_end:
+                if ids[i] == ids[j]:
+                    common += 1
+                    i += 1
+                    j += 1
+                elif ids[i] < ids[j]:
+                    i += 1
+                else:
+                    j += 1
+            similarities[k] = common / ((a_end - a_start) + (b_end - b_start) - common)
+        
+        return similarities
+else:
+    _adjacent_jaccard_kernel = _adjacent_jaccard_numpy
+
+
+class PatternSet:
+    """Case-insensitive regex set matched in a single scan of the text."""
+    
+    def __init__(self, patterns: List[str]):
+        self.patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self.combined = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+        
+        # Hyperscan matches every pattern in one SIMD DFA pass; its scratch space is
+        # not safe for concurrent scans, hence the lock
+        self._database = None
+        self._scan_lock = threading.Lock()
+        if hyperscan is not None:
+            try:
+                database = hyperscan.Database()
+                database.compile(
+                    expressions=[pattern.encode('utf-8') for pattern in patterns],
+                    ids=list(range(len(patterns))),
+                    flags=[HYPERSCAN_FLAGS] * len(patterns),
+                )
+                self._database = database
+            except Exception as e:
+                logger.warning("Hyperscan unavailable for pattern set, using re: %s", e)
+    
+    def search(self, text: str) -> bool:
+        """Return whether any pattern matches text."""
+        return self.combined.search(text) is not None
+    
+    def count(self, text: str) -> int:
+        """Count the patterns that match text."""
+        if self._database is not None:
+            matched = set()
+            with self._scan_lock:
+                self._database.scan(
+                    text.encode('utf-8'),
+                    match_event_handler=lambda pattern_id, start, end, flags, context: matched.add(pattern_id),
+                )
+            return len(matched)
+        
+        # The combined pattern rules out the common no-match case in one scan
+        if not self.combined.search(text):
+            return 0
+        return sum(1 for pattern in self.patterns if pattern.search(text))
+
+
+# Patterns that might indicate factual claims
+FACTUAL_PATTERNS = PatternSet([
+    r'\b\w+ is (the )?capital of \w+',
+    r'\b\w+ was born in \d{4}',
+    r'\b\w+ died in \d{4}',
+    r'\d+% of \w+',
+    r'according to \w+',
+    r'study shows',
+    r'research indicates',
+    r'\w+ causes \w+',
+    r'\w+ prevents \w+'
+])
+
+FALSE_CLAIM_PATTERNS = PatternSet([
+    r'\b\w+ is \w+ (girlfriend|boyfriend|wife|husband|partner)',
+    r'i am \w+ (owner|ceo|president|founder) of \w+',
+    r'\w+ (are|is) my (servant|employee|worker|slave)',
+    r'i own \w+ (company|corporation|business|industry)',
+    r'i am (billionaire|millionaire|richest|owner of)',
+    r'i control \w+ (company|corporation|business)',
+    r'i bought \w+ (company|corporation|business)',
+])
+
+MISINFORMATION_PATTERNS = PatternSet([
+    r'100% proven', r'doctors hate this', r'scientists don\'t want you to know',
+    r'big pharma', r'the truth they hide', r'wake up sheeple',
+    r'mainstream media lies', r'they don\'t want you to know',
+    r'exposed!', r'shocking truth'
+])
+
+BIAS_KEYWORDS = KeywordMatcher({
+    'extreme_positive': ['amazing', 'incredible', 'revolutionary', 'miraculous', 'perfect'],
+    'extreme_negative': ['terrible', 'horrible', 'disaster', 'catastrophe', 'nightmare'],
+    'emotional_triggers': ['urgent', 'shocking', 'secret', 'hidden', 'exposed', 'truth'],
+    'authority_appeals': ['experts', 'scientists', 'doctors', 'studies', 'research'],
+    'conspiracy': ['they', 'cover-up', 'hidden agenda', 'mainstream media', 'establishment']
+})
+
+GENERIC_PHRASES = KeywordMatcher({
+    'generic': [
+        "it is important to note",
+        "in conclusion",
+        "furthermore",
+        "moreover",
+        "it should be mentioned",
+        "it is worth noting",
+        "in summary",
+        "to summarize"
+    ]
+})
+
+# Known statements checked by cross_reference_facts, matched as whole phrases
+FACT_DATABASE = {
+    # Geography
+    'new delhi is capital of india': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'mumbai is capital of maharashtra': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'kolkata is capital of west bengal': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'chennai is capital of tamil nadu': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'bangalore is capital of karnataka': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'hyderabad is capital of telangana': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'washington dc is capital of usa': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'london is capital of england': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+    'paris is capital of france': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
+
+    # Science
+    'earth is round': {'truth': True, 'confidence': 1.0, 'source': 'Scientific Consensus'},
+    'earth is flat': {'truth': False, 'confidence': 1.0, 'source': 'Scientific Consensus'},
+    'vaccines cause autism': {'truth': False, 'confidence': 1.0, 'source': 'Medical Research'},
+    'climate change is real': {'truth': True, 'confidence': 1.0, 'source': 'Scientific Consensus'},
+
+    # Technology
+    'ai can think like humans': {'truth': False, 'confidence': 0.8, 'source': 'Current Technology Limits'},
+    'internet was invented in 1969': {'truth': True, 'confidence': 1.0, 'source': 'Historical Records'},
+
+    # Health
+    'smoking causes cancer': {'truth': True, 'confidence': 1.0, 'source': 'Medical Research'},
+    'water is essential for life': {'truth': True, 'confidence': 1.0, 'source': 'Biological Science'},
+}
+FACT_PHRASES = KeywordMatcher({'facts': list(FACT_DATABASE)})
+
+# Well-known true statements that raise the trust score when the text states them
+GEOGRAPHICAL_FACTS = {
+    'patna is capital of bihar': 95,
+    'delhi is capital of india': 95,
+    'mumbai is capital of maharashtra': 95,
+    'kolkata is capital of west bengal': 95,
+    'chennai is capital of tamil nadu': 95,
+    'bangalore is capital of karnataka': 95,
+    'hyderabad is capital of telangana': 95,
+    'washington is capital of usa': 95,
+    'london is capital of england': 95,
+    'paris is capital of france': 95,
+    'earth is round': 98,
+    'vaccines are safe': 95,
+    'climate change is real': 97,
+}
+GEOGRAPHICAL_FACT_PHRASES = KeywordMatcher({'facts': list(GEOGRAPHICAL_FACTS)})
+
+# Opinion and hedging markers; their density stands in for TextBlob's subjectivity
+SUBJECTIVITY_MARKERS = KeywordMatcher({
+    'subjective': [
+        'i think', 'i believe', 'i feel', 'in my opinion', 'personally', 'obviously',
+        'clearly', 'honestly', 'undoubtedly', 'probably', 'seems', 'should',
+        'must', 'best', 'worst', 'beautiful', 'awful', 'wonderful', 'ridiculous'
+    ]
+})
+
+# Topics used to pick recommended sources, checked in this order
+SOURCE_TOPICS = KeywordMatcher({
+    'health': ['health', 'medical', 'disease', 'treatment', 'medicine', 'vaccine'],
+    'climate': ['climate', 'global warming', 'environment', 'carbon', 'emissions'],
+    'technology': ['technology', 'ai', 'artificial intelligence', 'computer', 'software'],
+    'politics': ['politics', 'government', 'election', 'policy', 'democracy'],
+    'science': ['science', 'research', 'study', 'experiment', 'discovery'],
+})
+
+SENTENCE_MODEL = 'all-MiniLM-L6-v2'
+# INT8-quantized ONNX export published alongside the model; override for other CPUs
+# (e.g. onnx/model_qint8_avx512_vnni.onnx or onnx/model_qint8_arm64.onnx)
+SENTENCE_MODEL_ONNX_FILE = os.getenv("SENTENCE_MODEL_ONNX_FILE", "onnx/model_quint8_avx2.onnx")
+
+
+def load_sentence_model() -> "SentenceTransformer":
+    """Load the sentence transformer on ONNX Runtime with INT8 weights, falling back to PyTorch."""
+    from sentence_transformers import SentenceTransformer
+    
+    try:
+        return SentenceTransformer(
+            SENTENCE_MODEL, backend="onnx", model_kwargs={"file_name": SENTENCE_MODEL_ONNX_FILE}
+        )
+    except Exception as e:
+        logger.warning("ONNX sentence model unavailable, using PyTorch: %s", e)
+        return SentenceTransformer(SENTENCE_MODEL)
+
+
+# Concurrent semantic-similarity requests arriving within this window share one encode call
+ENCODE_BATCH_SIZE = 32
+ENCODE_BATCH_WINDOW = 0.005
+
+# en_core_web_sm components that claim extraction never reads; they are not loaded
+SPACY_UNUSED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
+# Longest prefix of a text given to the analyses, the summary and Azure (whose Text
+# Analytics rejects documents over 5,120 characters); the fact, claim-pattern and topic
+# scans read all of it. Bounds per-request CPU and memory on oversized input.
+MAX_MODEL_TEXT_CHARS = int(os.getenv("TEXT_MAX_MODEL_CHARS", "5120"))
+
+# Local analysis results kept per distinct text (keyed by a blake2b digest)
+RESULT_CACHE_MAX_ENTRIES = 2048
+RESULT_CACHE_DIGEST_SIZE = 16
+
+# Known misinformation patterns, embedded once when the sentence model loads
+MISINFORMATION_TEMPLATES = [
+    "Scientists don't want you to know this secret",
+    "Big pharma is hiding the truth about this miracle cure",
+    "Government officials are covering up this shocking discovery",
+    "Doctors hate this one simple trick",
+    "This will change everything you know about health",
+    "Media won't report on this breaking news",
+    "Exposed: The truth they don't want you to see"
+]
+
+
 class AdvancedTextAnalyzer:
     """Advanced text analysis with multiple AI models and techniques."""
     
     def __init__(self):
         self.vader_analyzer = SentimentIntensityAnalyzer()
         self.sentence_model = None
+        self.template_embeddings = None
         self.fake_news_model = None
         self.bias_model = None
         self.nlp = None
         self.kw_extractor = yake.KeywordExtractor(
             lan="en", n=3, dedupLim=0.7, top=10
         )
-        self.goose = Goose()
+        
+        # Micro-batching of concurrent sentence-transformer encodes
+        self._encode_queue: Optional[asyncio.Queue] = None
+        self._encode_worker: Optional[asyncio.Task] = None
+        self._encode_batches: set = set()
+        
+        # Most recently used local analysis results, by text digest
+        self._results: "OrderedDict[bytes, Tuple[Dict[str, Any], ...]]" = OrderedDict()
         
         # Initialize models lazily to improve startup time
         self._models_initialized = False
@@ -64,10 +425,16 @@ class AdvancedTextAnalyzer:
             
         try:
             # Load sentence transformer for semantic analysis
-            self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.sentence_model = load_sentence_model()
+            # float32 on both sides keeps the similarity a single sgemv
+            self.template_embeddings = np.ascontiguousarray(
+                self.sentence_model.encode(MISINFORMATION_TEMPLATES, normalize_embeddings=True, convert_to_numpy=True),
+                dtype=np.float32,
+            )
             
             # Load fake news detection model
             try:
+                from transformers import pipeline
                 self.fake_news_model = pipeline(
                     "text-classification",
                     model="martin-ha/toxic-comment-model",
@@ -76,48 +443,116 @@ class AdvancedTextAnalyzer:
             except:
                 self.fake_news_model = None
             
-            # Load spaCy for advanced NLP
+            # Load spaCy for sentence segmentation, the only thing claim extraction uses:
+            # the small model's standalone senter, without the tagger, parser and NER
             try:
-                self.nlp = spacy.load("en_core_web_sm")
+                import spacy
+                self.nlp = spacy.load("en_core_web_sm", exclude=SPACY_UNUSED_PIPES)
+                self.nlp.enable_pipe("senter")
             except OSError:
-                # Fallback if spaCy model not available
-                self.nlp = None
+                # Fallback if spaCy model not available: rule-based sentence boundaries
+                self.nlp = spacy.blank("en")
+                self.nlp.add_pipe("sentencizer")
             
             self._models_initialized = True
         except Exception as e:
             print(f"Model initialization warning: {e}")
             self._models_initialized = True
 
-    async def analyze_semantic_similarity(self, text: str) -> Dict[str, Any]:
+    async def run_analyses(self, view: TextView) -> Tuple[Any, ...]:
+        """Run the seven analyses concurrently, reusing the results for text seen recently.
+
+        Returns (bias, quality, claims, ai, facts, semantic, language); a failed
+        analysis is returned as its exception.
+        """
+        key = hashlib.blake2b(view.raw.encode("utf-8"), digest_size=RESULT_CACHE_DIGEST_SIZE).digest()
+        results = self._results.get(key)
+        if results is not None:
+            self._results.move_to_end(key)
+            return results
+        
+        # Only the fact lookup, a single automaton pass, reads beyond MAX_MODEL_TEXT_CHARS
+        model_view = view
+        if len(view.raw) > MAX_MODEL_TEXT_CHARS:
+            model_view = make_text_view(view.raw[:MAX_MODEL_TEXT_CHARS])
+        
+        # The synchronous analyses go to the worker threads
+        loop = asyncio.get_running_loop()
+        results = tuple(await asyncio.gather(
+            loop.run_in_executor(_cpu_pool, self.analyze_bias_and_subjectivity, model_view),
+            loop.run_in_executor(_cpu_pool, self.analyze_readability_and_quality, model_view),
+            loop.run_in_executor(_cpu_pool, self.extract_and_verify_claims, model_view),
+            loop.run_in_executor(_cpu_pool, self.detect_ai_generated_content, model_view),
+            loop.run_in_executor(_cpu_pool, self.cross_reference_facts, view),
+            self.analyze_semantic_similarity(model_view),
+            loop.run_in_executor(_cpu_pool, self.detect_language, model_view),
+            return_exceptions=True
+        ))
+        
+        # Only complete results are reused; failures are retried on the next request
+        if all(isinstance(result, dict) and not result.get("error") for result in results):
+            self._results[key] = results
+            if len(self._results) > RESULT_CACHE_MAX_ENTRIES:
+                self._results.popitem(last=False)
+        return results
+    
+    async def _embed(self, text: str) -> np.ndarray:
+        """Queue text for the next sentence-transformer batch and wait for its embedding."""
+        if self._encode_worker is None or self._encode_worker.done():
+            self._encode_queue = asyncio.Queue()
+            self._encode_worker = asyncio.create_task(self._collect_encode_batches())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._encode_queue.put((text, future))
+        return await future
+    
+    async def _collect_encode_batches(self):
+        """Coalesce texts queued within ENCODE_BATCH_WINDOW into encode calls of up to ENCODE_BATCH_SIZE texts."""
+        queue = self._encode_queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(ENCODE_BATCH_WINDOW)
+            while len(batch) < ENCODE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            # Encode without blocking collection of the next batch
+            task = asyncio.create_task(self._encode_batch(batch))
+            self._encode_batches.add(task)
+            task.add_done_callback(self._encode_batches.discard)
+    
+    async def _encode_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        texts = [text for text, _ in batch]
+        try:
+            # encode() sorts the batch by length internally, so padding stays small
+            embeddings = await asyncio.to_thread(
+                self.sentence_model.encode, texts,
+                batch_size=len(texts), normalize_embeddings=True, convert_to_numpy=True
+            )
+            embeddings = embeddings.astype(np.float32, copy=False)
+            for embedding, (_, future) in zip(embeddings, batch):
+                if not future.done():
+                    future.set_result(embedding)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def analyze_semantic_similarity(self, view: TextView) -> Dict[str, Any]:
         """Analyze semantic similarity to known misinformation patterns."""
         if not self.sentence_model:
             return {"similarity_score": 0.0, "patterns": []}
         
         try:
-            # Known misinformation patterns
-            misinformation_templates = [
-                "Scientists don't want you to know this secret",
-                "Big pharma is hiding the truth about this miracle cure",
-                "Government officials are covering up this shocking discovery",
-                "Doctors hate this one simple trick",
-                "This will change everything you know about health",
-                "Media won't report on this breaking news",
-                "Exposed: The truth they don't want you to see"
-            ]
-            
-            text_embedding = self.sentence_model.encode([text])
-            template_embeddings = self.sentence_model.encode(misinformation_templates)
+            # Embeddings are L2-normalized, so the dot product is the cosine similarity
+            text_embedding = await self._embed(view.raw)
+            similarities = self.template_embeddings @ text_embedding
+            max_similarity = float(similarities.max())
             
-            similarities = cosine_similarity(text_embedding, template_embeddings)[0]
-            max_similarity = float(np.max(similarities))
-            
-            similar_patterns = []
-            for i, sim in enumerate(similarities):
-                if sim > 0.6:  # High similarity threshold
-                    similar_patterns.append({
-                        "pattern": misinformation_templates[i],
-                        "similarity": float(sim)
-                    })
+            # High similarity threshold
+            similar_patterns = [
+                {"pattern": MISINFORMATION_TEMPLATES[i], "similarity": float(similarities[i])}
+                for i in np.flatnonzero(similarities > 0.6)
+            ]
             
             return {
                 "similarity_score": max_similarity,
@@ -126,39 +561,28 @@ class AdvancedTextAnalyzer:
         except Exception as e:
             return {"error": str(e), "similarity_score": 0.0, "patterns": []}
 
-    async def analyze_bias_and_subjectivity(self, text: str) -> Dict[str, Any]:
+    def analyze_bias_and_subjectivity(self, view: TextView) -> Dict[str, Any]:
         """Analyze text for bias, subjectivity, and emotional manipulation."""
         try:
             # VADER sentiment analysis (better for social media text)
-            vader_scores = self.vader_analyzer.polarity_scores(text)
+            vader_scores = self.vader_analyzer.polarity_scores(view.raw)
             
-            # TextBlob analysis
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-            
-            # Bias indicators
-            bias_words = {
-                'extreme_positive': ['amazing', 'incredible', 'revolutionary', 'miraculous', 'perfect'],
-                'extreme_negative': ['terrible', 'horrible', 'disaster', 'catastrophe', 'nightmare'],
-                'emotional_triggers': ['urgent', 'shocking', 'secret', 'hidden', 'exposed', 'truth'],
-                'authority_appeals': ['experts', 'scientists', 'doctors', 'studies', 'research'],
-                'conspiracy': ['they', 'cover-up', 'hidden agenda', 'mainstream media', 'establishment']
-            }
+            polarity = vader_scores['compound']
             
-            bias_scores = {}
-            text_lower = text.lower()
+            # Subjectivity: share of sentiment-bearing text blended with opinion-marker density
+            word_count = len(view.words)
+            marker_density = min(1.0, SUBJECTIVITY_MARKERS.count(view.lower)['subjective'] / max(1, word_count / 10))
+            subjectivity = 0.5 * (1.0 - vader_scores['neu']) + 0.5 * marker_density
             
-            for category, words in bias_words.items():
-                count = sum(1 for word in words if word in text_lower)
-                bias_scores[category] = count
+            # Bias indicators
+            bias_scores = BIAS_KEYWORDS.count(view.lower)
             
             # Emotional manipulation score
             emotional_score = (
                 bias_scores['extreme_positive'] + 
                 bias_scores['extreme_negative'] + 
                 bias_scores['emotional_triggers']
-            ) / max(1, len(text.split()) / 10)
+            ) / max(1, word_count / 10)
             
             return {
                 "vader_sentiment": vader_scores,
@@ -171,20 +595,32 @@ class AdvancedTextAnalyzer:
         except Exception as e:
             return {"error": str(e)}
 
-    async def analyze_readability_and_quality(self, text: str) -> Dict[str, Any]:
+    def detect_language(self, view: TextView) -> Dict[str, Any]:
+        """Detect the language of the text."""
+        try:
+            return {"language": detect(view.raw)}
+        except LangDetectException:
+            return {"language": "unknown"}
+    
+    def analyze_readability_and_quality(self, view: TextView) -> Dict[str, Any]:
         """Analyze text readability and quality metrics."""
         try:
-            # Readability scores
-            flesch_reading_ease = textstat.flesch_reading_ease(text)
-            flesch_kincaid_grade = textstat.flesch_kincaid_grade(text)
-            gunning_fog = textstat.gunning_fog(text)
-            automated_readability = textstat.automated_readability_index(text)
+            # Readability scores, all derived from the same counts
+            n_chars, n_words, sentence_count, n_syllables, n_complex = _text_stats(view)
+            if n_words and sentence_count:
+                words_per_sentence = n_words / sentence_count
+                syllables_per_word = n_syllables / n_words
+                flesch_reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+                flesch_kincaid_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+                gunning_fog = 0.4 * (words_per_sentence + 100 * n_complex / n_words)
+                automated_readability = 4.71 * n_chars / n_words + 0.5 * words_per_sentence - 21.43
+            else:
+                flesch_reading_ease = flesch_kincaid_grade = gunning_fog = automated_readability = 0.0
             
             # Text statistics
-            word_count = len(text.split())
-            sentence_count = textstat.sentence_count(text)
+            word_count = len(view.words)
             avg_sentence_length = word_count / max(1, sentence_count)
-            lexical_diversity = len(set(text.lower().split())) / max(1, word_count)
+            lexical_diversity = len(view.word_set) / max(1, word_count)
             
             # Quality indicators
             quality_score = 100
@@ -221,44 +657,29 @@ class AdvancedTextAnalyzer:
         except Exception as e:
             return {"error": str(e)}
 
-    async def extract_and_verify_claims(self, text: str) -> Dict[str, Any]:
+    def extract_and_verify_claims(self, view: TextView) -> Dict[str, Any]:
         """Extract factual claims and attempt verification."""
         try:
             claims = []
             
             # Extract potential factual claims using NLP
             if self.nlp:
-                doc = self.nlp(text)
+                doc = self.nlp(view.raw)
                 
                 # Look for factual patterns
                 for sent in doc.sents:
                     sent_text = sent.text.strip()
                     
                     # Patterns that might indicate factual claims
-                    factual_patterns = [
-                        r'\b\w+ is (the )?capital of \w+',
-                        r'\b\w+ was born in \d{4}',
-                        r'\b\w+ died in \d{4}',
-                        r'\d+% of \w+',
-                        r'according to \w+',
-                        r'study shows',
-                        r'research indicates',
-                        r'\w+ causes \w+',
-                        r'\w+ prevents \w+'
-                    ]
-                    
-                    for pattern in factual_patterns:
-                        if re.search(pattern, sent_text, re.IGNORECASE):
-                            claims.append({
-                                "claim": sent_text,
-                                "confidence": 0.7,
-                                "type": "factual"
-                            })
-                            break
+                    if FACTUAL_PATTERNS.search(sent_text):
+                        claims.append({
+                            "claim": sent_text,
+                            "confidence": 0.7,
+                            "type": "factual"
+                        })
             else:
                 # Fallback without spaCy
-                sentences = text.split('.')
-                for sent in sentences[:5]:  # Check first 5 sentences
+                for sent in view.sentences[:5]:  # Check first 5 sentences
                     if any(keyword in sent.lower() for keyword in ['is', 'was', 'according', 'study', 'research']):
                         claims.append({
                             "claim": sent.strip(),
@@ -267,7 +688,7 @@ class AdvancedTextAnalyzer:
                         })
             
             # Extract key phrases for fact-checking
-            keywords = self.kw_extractor.extract_keywords(text)
+            keywords = self.kw_extractor.extract_keywords(view.raw)
             key_phrases = [kw[1] for kw in keywords[:5]]
             
             return {
@@ -278,7 +699,7 @@ class AdvancedTextAnalyzer:
         except Exception as e:
             return {"error": str(e), "claims": [], "key_phrases": []}
 
-    async def detect_ai_generated_content(self, text: str) -> Dict[str, Any]:
+    def detect_ai_generated_content(self, view: TextView) -> Dict[str, Any]:
         """Detect if text might be AI-generated."""
         try:
             ai_indicators = {
@@ -290,46 +711,31 @@ class AdvancedTextAnalyzer:
             }
             
             # Check for repetitive patterns
-            sentences = text.split('.')
-            sentence_similarities = []
+            sentences = view.sentences
             
             if len(sentences) > 2:
-                for i in range(len(sentences) - 1):
-                    s1 = sentences[i].strip().lower()
-                    s2 = sentences[i + 1].strip().lower()
-                    if s1 and s2:
-                        similarity = len(set(s1.split()) & set(s2.split())) / max(1, len(set(s1.split()) | set(s2.split())))
-                        sentence_similarities.append(similarity)
+                # Jaccard similarity of neighbouring sentences over integer word IDs
+                ids, offsets = _sentence_token_ids(sentences)
+                similarities = _adjacent_jaccard_kernel(ids, offsets)
+                sentence_similarities = similarities[similarities >= 0]
                 
-                if sentence_similarities:
-                    avg_similarity = sum(sentence_similarities) / len(sentence_similarities)
+                if len(sentence_similarities):
+                    avg_similarity = float(sentence_similarities.mean())
                     if avg_similarity > 0.6:
                         ai_indicators["repetitive_patterns"] = 1
             
             # Check for generic language
-            generic_phrases = [
-                "it is important to note",
-                "in conclusion",
-                "furthermore",
-                "moreover",
-                "it should be mentioned",
-                "it is worth noting",
-                "in summary",
-                "to summarize"
-            ]
-            
-            generic_count = sum(1 for phrase in generic_phrases if phrase in text.lower())
+            generic_count = GENERIC_PHRASES.count(view.lower)["generic"]
             if generic_count > 2:
                 ai_indicators["generic_language"] = 1
             
-            # Check grammar perfection (AI tends to have perfect grammar)
-            blob = TextBlob(text)
-            try:
-                corrected = str(blob.correct())
-                if corrected == text and len(text) > 100:
+            # Check grammar perfection (AI tends to have perfect grammar): nearly every word
+            # is in TextBlob's spelling vocabulary, without running its per-word corrector
+            if len(view.raw) > 100:
+                words = [word for word in WORD_PATTERN.findall(view.lower) if len(word) > 1]
+                unknown = sum(1 for word in words if word not in spelling_vocabulary)
+                if words and unknown / len(words) < 0.01:
                     ai_indicators["perfect_grammar"] = 1
-            except:
-                pass
             
             # Calculate AI likelihood
             total_indicators = sum(ai_indicators[key] for key in ["repetitive_patterns", "unnatural_flow", "generic_language", "perfect_grammar"])
@@ -339,45 +745,16 @@ class AdvancedTextAnalyzer:
         except Exception as e:
             return {"error": str(e), "ai_likelihood": 0.0}
 
-    async def cross_reference_facts(self, text: str) -> Dict[str, Any]:
+    def cross_reference_facts(self, view: TextView) -> Dict[str, Any]:
         """Cross-reference facts with reliable sources."""
         try:
-            # Enhanced fact database
-            fact_database = {
-                # Geography
-                'new delhi is capital of india': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'mumbai is capital of maharashtra': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'kolkata is capital of west bengal': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'chennai is capital of tamil nadu': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'bangalore is capital of karnataka': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'hyderabad is capital of telangana': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'washington dc is capital of usa': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'london is capital of england': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                'paris is capital of france': {'truth': True, 'confidence': 1.0, 'source': 'Official Government'},
-                
-                # Science
-                'earth is round': {'truth': True, 'confidence': 1.0, 'source': 'Scientific Consensus'},
-                'earth is flat': {'truth': False, 'confidence': 1.0, 'source': 'Scientific Consensus'},
-                'vaccines cause autism': {'truth': False, 'confidence': 1.0, 'source': 'Medical Research'},
-                'climate change is real': {'truth': True, 'confidence': 1.0, 'source': 'Scientific Consensus'},
-                
-                # Technology
-                'ai can think like humans': {'truth': False, 'confidence': 0.8, 'source': 'Current Technology Limits'},
-                'internet was invented in 1969': {'truth': True, 'confidence': 1.0, 'source': 'Historical Records'},
-                
-                # Health
-                'smoking causes cancer': {'truth': True, 'confidence': 1.0, 'source': 'Medical Research'},
-                'water is essential for life': {'truth': True, 'confidence': 1.0, 'source': 'Biological Science'},
-            }
-            
-            text_normalized = re.sub(r'[^\w\s]', '', text.lower().strip())
-            
             verified_facts = []
             contradicted_facts = []
             
-            for fact, info in fact_database.items():
-                # Check for exact or partial matches
-                if fact in text_normalized or any(word in text_normalized for word in fact.split() if len(word) > 3):
+            # One pass over the text finds every fact phrase it contains
+            matched = FACT_PHRASES.found(view.normalized)
+            for fact, info in FACT_DATABASE.items():
+                if fact in matched:
                     if info['truth']:
                         verified_facts.append({
                             'statement': fact,
@@ -400,47 +777,56 @@ class AdvancedTextAnalyzer:
             return {'error': str(e), 'verified_facts': [], 'contradicted_facts': []}
 
 
-async def analyze_text(text: str) -> Dict[str, Any]:
+# Process-wide analyzer so models are loaded once, not per request
+_analyzer: Optional[AdvancedTextAnalyzer] = None
+_analyzer_lock = asyncio.Lock()
+
+
+async def get_analyzer() -> AdvancedTextAnalyzer:
+    """Return the shared analyzer, loading its models on first use."""
+    global _analyzer
+    if _analyzer is None:
+        async with _analyzer_lock:
+            if _analyzer is None:
+                analyzer = AdvancedTextAnalyzer()
+                await analyzer.initialize_models()
+                _analyzer = analyzer
+    return _analyzer
+
+
+async def analyze_text(text: str) -> TextResult:
     """Analyze text for trustworthiness, sentiment, and provide comprehensive analysis."""
     
-    # Initialize advanced analyzer
-    analyzer = AdvancedTextAnalyzer()
-    await analyzer.initialize_models()
+    # Nothing to analyze: answer before loading models or calling Azure
+    if not text.strip():
+        return make_text_result(50, 'Insufficient Text', '', 'Neutral', [])
     
-    # Detect language
-    try:
-        detected_language = detect(text)
-    except LangDetectException:
-        detected_language = "unknown"
+    model_text = text[:MAX_MODEL_TEXT_CHARS]
     
-    # Basic sentiment analysis using TextBlob
-    blob = TextBlob(text)
-    sentiment_score = blob.sentiment.polarity
+    # Start the Azure calls now so their network time overlaps the local analysis
+    azure_task = asyncio.create_task(azure_ai.analyze_text_all(model_text))
     
-    if sentiment_score > 0.1:
-        sentiment = 'Positive'
-    elif sentiment_score < -0.1:
-        sentiment = 'Negative'  
-    else:
-        sentiment = 'Neutral'
+    # Shared advanced analyzer (models load on the first request)
+    analyzer = await get_analyzer()
     
     # Initialize trust score
     trust = 70
     verdict = 'Neutral'
     
+    # Lowered, tokenized and normalized once for every analysis below
+    view = make_text_view(text)
+    
     # Perform comprehensive analysis
     try:
-        # Run all analyses concurrently
-        bias_task = analyzer.analyze_bias_and_subjectivity(text)
-        quality_task = analyzer.analyze_readability_and_quality(text)
-        claims_task = analyzer.extract_and_verify_claims(text)
-        ai_task = analyzer.detect_ai_generated_content(text)
-        facts_task = analyzer.cross_reference_facts(text)
-        semantic_task = analyzer.analyze_semantic_similarity(text)
+        # Run all analyses concurrently (or reuse them for a recently seen text)
+        (
+            bias_analysis, quality_analysis, claims_analysis, ai_analysis, facts_analysis, semantic_analysis,
+            language_analysis,
+        ) = await analyzer.run_analyses(view)
         
-        bias_analysis, quality_analysis, claims_analysis, ai_analysis, facts_analysis, semantic_analysis = await asyncio.gather(
-            bias_task, quality_task, claims_task, ai_task, facts_task, semantic_task,
-            return_exceptions=True
+        # Detected language, shared with the cached results
+        detected_language = (
+            language_analysis.get("language", "unknown") if isinstance(language_analysis, dict) else "unknown"
         )
         
         # Adjust trust based on comprehensive analysis
@@ -455,8 +841,10 @@ async def analyze_text(text: str) -> Dict[str, Any]:
                 trust -= 20
                 verdict = "Moderate Bias Detected"
             
+            # On the VADER/marker scale 0.6 takes dense opinion markers plus a
+            # sentiment-heavy tone; it flags about as many texts as TextBlob's 0.8 did
             subjectivity = bias_analysis.get("subjectivity", 0)
-            if subjectivity > 0.8:
+            if subjectivity > 0.6:
                 trust -= 15  # Highly subjective content
         
         # 2. Quality analysis
@@ -520,108 +908,88 @@ async def analyze_text(text: str) -> Dict[str, Any]:
         facts_analysis = {"error": str(e)}
         semantic_analysis = {"error": str(e)}
     
-    # Enhanced false claim detection (existing logic)
-    false_claim_patterns = [
-        r'\b\w+ is \w+ (girlfriend|boyfriend|wife|husband|partner)',
-        r'i am \w+ (owner|ceo|president|founder) of \w+',
-        r'\w+ (are|is) my (servant|employee|worker|slave)',
-        r'i own \w+ (company|corporation|business|industry)',
-        r'i am (billionaire|millionaire|richest|owner of)',
-        r'i control \w+ (company|corporation|business)',
-        r'i bought \w+ (company|corporation|business)',
-    ]
+    # Basic sentiment from the VADER compound score the bias analysis already
+    # computed on the same text; scored directly, off the loop, only if it failed
+    if isinstance(bias_analysis, dict) and "polarity" in bias_analysis:
+        sentiment_score = bias_analysis["polarity"]
+    else:
+        vader_scores = await asyncio.get_running_loop().run_in_executor(
+            _cpu_pool, analyzer.vader_analyzer.polarity_scores, model_text
+        )
+        sentiment_score = vader_scores['compound']
+    
+    if sentiment_score > 0.1:
+        sentiment = 'Positive'
+    elif sentiment_score < -0.1:
+        sentiment = 'Negative'  
+    else:
+        sentiment = 'Neutral'
     
-    false_claim_count = sum(1 for pattern in false_claim_patterns 
-                           if re.search(pattern, text, re.IGNORECASE))
+    # Enhanced false claim detection (existing logic)
+    false_claim_count = FALSE_CLAIM_PATTERNS.count(text)
     
     if false_claim_count > 0:
         trust = max(0, trust - (false_claim_count * 30))
         verdict = 'False Claims Detected'
     
     # Enhanced misinformation pattern detection
-    misinformation_patterns = [
-        r'100% proven', r'doctors hate this', r'scientists don\'t want you to know',
-        r'big pharma', r'the truth they hide', r'wake up sheeple',
-        r'mainstream media lies', r'they don\'t want you to know',
-        r'exposed!', r'shocking truth'
-    ]
-    
-    misinformation_count = sum(1 for pattern in misinformation_patterns 
-                              if re.search(pattern, text, re.IGNORECASE))
+    misinformation_count = MISINFORMATION_PATTERNS.count(text)
     
     if misinformation_count > 0:
         trust -= misinformation_count * 20
         verdict = 'Potential Misinformation'
     
     # Knowledge base verification for factual statements
-    geographical_facts = {
-        'patna is capital of bihar': 95,
-        'delhi is capital of india': 95,
-        'mumbai is capital of maharashtra': 95,
-        'kolkata is capital of west bengal': 95,
-        'chennai is capital of tamil nadu': 95,
-        'bangalore is capital of karnataka': 95,
-        'hyderabad is capital of telangana': 95,
-        'washington is capital of usa': 95,
-        'london is capital of england': 95,
-        'paris is capital of france': 95,
-        'earth is round': 98,
-        'vaccines are safe': 95,
-        'climate change is real': 97,
-    }
-    
-    text_normalized = re.sub(r'[^\w\s]', '', text.lower().strip())
-    for fact, score in geographical_facts.items():
-        if text_normalized in fact or fact in text_normalized:
-            trust = max(trust, score - 5)
+    matched_facts = GEOGRAPHICAL_FACT_PHRASES.found(view.normalized)
+    for fact in GEOGRAPHICAL_FACTS:
+        if fact in matched_facts:
+            trust = max(trust, GEOGRAPHICAL_FACTS[fact] - 5)
             verdict = 'Verified Factual Statement'
             break
     
     # Generate summary
-    sentences = list(blob.sentences)
-    if len(sentences) >= 3:
-        summary_sentences = sentences[:3]
-        summary = ' '.join(str(s) for s in summary_sentences)
+    if len(view.sentences) >= 3:
+        summary = ' '.join(view.sentences[:3])
     else:
-        summary = text
+        summary = model_text
     
     if len(summary) > 300:
         summary = summary[:297] + '...'
     
     # Enhanced source recommendations based on content analysis
     sources: List[Dict[str, Any]] = []
-    text_lower = text.lower()
+    topics = SOURCE_TOPICS.count(view.lower)
     
     # Categorize content and provide relevant sources
-    if any(term in text_lower for term in ['health', 'medical', 'disease', 'treatment', 'medicine', 'vaccine']):
+    if topics['health']:
         sources.extend([
             {"web": {"uri": "https://www.who.int", "title": "World Health Organization"}},
             {"web": {"uri": "https://www.mayoclinic.org", "title": "Mayo Clinic"}},
             {"web": {"uri": "https://pubmed.ncbi.nlm.nih.gov", "title": "PubMed Medical Research"}},
             {"web": {"uri": "https://www.cdc.gov", "title": "Centers for Disease Control"}},
         ])
-    elif any(term in text_lower for term in ['climate', 'global warming', 'environment', 'carbon', 'emissions']):
+    elif topics['climate']:
         sources.extend([
             {"web": {"uri": "https://www.ipcc.ch", "title": "IPCC Climate Reports"}},
             {"web": {"uri": "https://climate.nasa.gov", "title": "NASA Climate Change"}},
             {"web": {"uri": "https://www.epa.gov", "title": "EPA Environmental Information"}},
             {"web": {"uri": "https://www.noaa.gov", "title": "NOAA Climate Data"}},
         ])
-    elif any(term in text_lower for term in ['technology', 'ai', 'artificial intelligence', 'computer', 'software']):
+    elif topics['technology']:
         sources.extend([
             {"web": {"uri": "https://www.nature.com/subjects/computer-science", "title": "Nature Computer Science"}},
             {"web": {"uri": "https://spectrum.ieee.org", "title": "IEEE Spectrum"}},
             {"web": {"uri": "https://arxiv.org/list/cs/recent", "title": "arXiv Computer Science"}},
             {"web": {"uri": "https://www.acm.org", "title": "Association for Computing Machinery"}},
         ])
-    elif any(term in text_lower for term in ['politics', 'government', 'election', 'policy', 'democracy']):
+    elif topics['politics']:
         sources.extend([
             {"web": {"uri": "https://www.factcheck.org", "title": "FactCheck.org"}},
             {"web": {"uri": "https://www.politifact.com", "title": "PolitiFact"}},
             {"web": {"uri": "https://www.snopes.com", "title": "Snopes"}},
             {"web": {"uri": "https://www.allsides.com", "title": "AllSides"}},
         ])
-    elif any(term in text_lower for term in ['science', 'research', 'study', 'experiment', 'discovery']):
+    elif topics['science']:
         sources.extend([
             {"web": {"uri": "https://www.nature.com", "title": "Nature Scientific Journal"}},
             {"web": {"uri": "https://www.sciencemag.org", "title": "Science Magazine"}},
@@ -638,7 +1006,9 @@ async def analyze_text(text: str) -> Dict[str, Any]:
     
     # Azure AI Enhanced Analysis
     try:
-        azure_text_analysis = await azure_ai.analyze_text_with_azure(text)
+        # Text Analytics and Content Safety ran concurrently alongside everything above
+        azure_results = await azure_task
+        azure_text_analysis = azure_results["text_analytics"]
         if azure_text_analysis.get("azure_text_analysis") == "success":
             azure_sentiment = azure_text_analysis.get("sentiment", {})
             
@@ -648,7 +1018,7 @@ async def analyze_text(text: str) -> Dict[str, Any]:
                 trust -= 5  # Minor penalty for sentiment inconsistency
         
         # Azure Content Safety check
-        safety_analysis = await azure_ai.check_content_safety_text(text)
+        safety_analysis = azure_results["content_safety"]
         if safety_analysis.get("content_safety") == "success":
             safety_categories = safety_analysis.get("categories", {})
             for category, details in safety_categories.items():
@@ -678,5 +1048,4 @@ async def analyze_text(text: str) -> Dict[str, Any]:
     else:
         verdict = 'High Risk Content'
     
-    await asyncio.sleep(0.2)
     return make_text_result(trust, verdict, summary, sentiment, sources)
\ No newline at end of file
@@ -1,43 +1,398 @@
 import asyncio
+import random
+import time
 import ssl
-import socket
 import re
-import json
+import weakref
+import dns.asyncresolver
 import dns.resolver
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from urllib.parse import urlparse, urljoin
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup, SoupStrainer
 import tldextract
-from fake_useragent import UserAgent
-from cryptography import x509
-from cryptography.hazmat.backends import default_backend
-import OpenSSL
 try:
     import whois
 except ImportError:
     whois = None
-from datetime import datetime, timedelta
-from .models import make_url_result
+from datetime import timezone
+from .models import make_url_result, InfoItem, UrlResult
+from .keywords import KeywordMatcher
+
+# Only the tags the privacy and tracking scans read are built into the BS4 fallback's tree
+PAGE_STRAINER = SoupStrainer(['a', 'script']) if LexborHTMLParser is None else None
+
+# Privacy-policy practices, all found in one case-insensitive scan of the raw policy bytes
+POLICY_KEYWORDS = KeywordMatcher({
+    'collection': ['collect', 'gathering', 'obtain', 'receive'],
+    'personal': ['personal', 'pii', 'identifiable'],
+    'sharing': ['third party', 'share', 'sell', 'partner'],
+    'tracking': ['cookie', 'tracking', 'pixel'],
+    'user_rights': ['delete', 'remove', 'opt-out', 'unsubscribe'],
+})
+
+# Common privacy policy URLs, probed concurrently when the home page has no link
+POLICY_PATHS = (
+    '/privacy', '/privacy-policy', '/privacy.html', '/privacypolicy',
+    '/legal/privacy', '/terms/privacy', '/privacy-statement'
+)
+
+# Splits hosts on the public suffix list bundled with tldextract (no download, no disk cache)
+_extract = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=())
+
+# Domain reputation lists, matched exactly against the registered domain
+# (so evil-google.com is not google.com) or the public suffix
+TRUSTED_DOMAINS = frozenset((
+    'google.com', 'youtube.com', 'facebook.com', 'twitter.com', 'instagram.com',
+    'linkedin.com', 'github.com', 'stackoverflow.com', 'reddit.com', 'wikipedia.org',
+    'amazon.com', 'microsoft.com', 'apple.com', 'netflix.com', 'adobe.com'
+))
+SUSPICIOUS_TLDS = frozenset(('tk', 'ml', 'ga', 'cf', 'click', 'download', 'top'))
+URL_SHORTENERS = frozenset(('bit.ly', 'tinyurl.com', 't.co', 'goo.gl', 'ow.ly', 'short.link'))
+# Simulated backlink profiles (total, reputable) for the best-known trusted domains
+TRUSTED_BACKLINKS = {
+    'youtube.com': (50000, 45000),
+    'google.com': (75000, 70000),
+    'facebook.com': (40000, 35000),
+    'github.com': (30000, 28000),
+}
+DEFAULT_TRUSTED_BACKLINKS = (15000, 12000)
+PHISHING_WORDS = ('secure', 'login', 'bank', 'paypal', 'amazon')
+# Hosts using phishing words outside these are flagged
+PHISHING_SAFE_SUFFIXES = ('.com', '.org', '.gov', '.edu')
+# Host (optionally with a port) that is a bare IPv4 address
+IP_ADDRESS_PATTERN = re.compile(r'\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?$')
+
+# Response header -> (result flag, score contribution)
+SECURITY_HEADERS = {
+    'strict-transport-security': ('hsts', 20),
+    'x-xss-protection': ('xss_protection', 15),
+    'x-content-type-options': ('content_type_options', 15),
+    'x-frame-options': ('frame_options', 15),
+    'content-security-policy': ('csp', 25),
+    'referrer-policy': ('referrer_policy', 10),
+}
+
+HTTP_POOL_SIZE = 64
+# Fact-check searches all go to one search engine; this keeps a burst of them from
+# taking every pooled connection away from URL analyses
+HTTP_POOL_SIZE_PER_HOST = 20
+MAIN_PAGE_TIMEOUT = aiohttp.ClientTimeout(total=15)
+PAGE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=5)
+CERT_TIMEOUT = 10
+# Pages are read up to this many (decompressed) bytes; links, trackers and
+# policy wording sit well inside it
+MAX_BODY_BYTES = 512 * 1024
+BODY_CHUNK_BYTES = 64 * 1024
+
+# Current desktop browsers; one is picked per analyzer
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0',
+)
+
+DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Shared by all outbound analyzer traffic (the realtime fact checker included) so
+# keep-alive connections are reused, opened on first use inside the running event
+# loop. A session only works on the loop it was created in, so each loop gets its
+# own, kept here until aclose() closes it.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def get_session() -> aiohttp.ClientSession:
+    """The running loop's outbound HTTP session; closed by aclose() at shutdown."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = _sessions[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=HTTP_POOL_SIZE,
+                limit_per_host=HTTP_POOL_SIZE_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            headers=DEFAULT_HEADERS,
+        )
+    return session
+
+
+# Verifying context for the certificate check; built once so its CA store and
+# session cache are reused
+_ssl_context = ssl.create_default_context()
+
+# One resolver for every analysis, so its answer cache and nameserver config are shared
+_resolver = dns.asyncresolver.Resolver()
+_resolver.cache = dns.resolver.LRUCache()
+
+
+# WHOIS, DNS and certificate data change slowly, so they are reused per domain for an hour
+DOMAIN_CACHE_TTL = 3600
+DOMAIN_CACHE_MAX_ENTRIES = 4096
+# Registration data changes on the order of days
+WHOIS_CACHE_TTL = 86400
+SECONDS_PER_DAY = 86400
+WHOIS_MAX_WORKERS = 8
+
+
+class DomainCache:
+    """TTL'd LRU of per-domain lookups. Concurrent misses on one key wait for a single lookup."""
+    
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+    
+    def _lookup(self, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+    
+    async def get(
+        self,
+        key: Tuple[str, str],
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """Return the cached value for key, computing and storing it on a miss.
+
+        Exceptions and values rejected by cacheable are passed to the callers already
+        waiting on the lookup but not stored.
+        """
+        # The lookup and the in-flight registration, and later the cache insert and
+        # the in-flight removal, each run with no await between them, so no other
+        # request on the loop can see a key that is neither cached nor in flight
+        while True:
+            hit, value = self._lookup(key)
+            if hit:
+                return value
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the request running the lookup was cancelled; take it over
+                if not pending.cancelled():
+                    raise
+        
+        pending = self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await compute()
+        except BaseException as e:
+            del self._pending[key]
+            if isinstance(e, asyncio.CancelledError):
+                pending.cancel()
+            else:
+                pending.set_exception(e)
+                # Retrieved here, so asyncio does not warn when nobody was waiting
+                pending.exception()
+            raise
+        
+        if cacheable(value):
+            self._entries[key] = (time.monotonic(), value)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        del self._pending[key]
+        pending.set_result(value)
+        return value
+
+
+_domain_cache = DomainCache(DOMAIN_CACHE_TTL, DOMAIN_CACHE_MAX_ENTRIES)
+_whois_cache = DomainCache(WHOIS_CACHE_TTL, DOMAIN_CACHE_MAX_ENTRIES)
+
+# python-whois talks to WHOIS servers over blocking sockets, so lookups run here
+_whois_pool = ThreadPoolExecutor(max_workers=WHOIS_MAX_WORKERS, thread_name_prefix="whois")
+
+
+def _query_whois(domain: str) -> Tuple[Optional[float], str]:
+    domain_whois = whois.whois(domain)
+    creation_date = domain_whois.creation_date
+    if isinstance(creation_date, list):
+        creation_date = creation_date[0]
+    
+    created_at = None
+    if creation_date:
+        # WHOIS servers mostly report UTC; naive dates are taken as UTC
+        if creation_date.tzinfo is None:
+            creation_date = creation_date.replace(tzinfo=timezone.utc)
+        created_at = creation_date.timestamp()
+    
+    return created_at, domain_whois.registrar or "Unknown"
+
+
+async def lookup_whois(domain: str) -> Tuple[Optional[float], str]:
+    """Return the domain's creation time (epoch seconds) and registrar, cached per domain."""
+    loop = asyncio.get_running_loop()
+    return await _whois_cache.get(
+        (domain, 'whois'), lambda: loop.run_in_executor(_whois_pool, _query_whois, domain)
+    )
+
+
+async def fetch_certificate(domain: str, port: int) -> Optional[Dict[str, Any]]:
+    """Complete a TLS handshake with the host and return its validated certificate."""
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(domain, port, ssl=_ssl_context, server_hostname=domain),
+        timeout=CERT_TIMEOUT
+    )
+    try:
+        return writer.get_extra_info('ssl_object').getpeercert()
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (OSError, ssl.SSLError):
+            pass
+
+
+async def read_capped(response: aiohttp.ClientResponse, limit: int = MAX_BODY_BYTES) -> bytes:
+    """Read at most limit bytes of the response body."""
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(BODY_CHUNK_BYTES):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b''.join(chunks)[:limit]
+
+
+async def aclose():
+    """Close the shared HTTP connection pools, each on the loop that owns it."""
+    loop = asyncio.get_running_loop()
+    for session_loop, session in list(_sessions.items()):
+        if session.closed:
+            continue
+        if session_loop is loop:
+            await session.close()
+        elif session_loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), session_loop))
+
+
+@dataclass(slots=True)
+class DomainFlags:
+    """Everything the trust score needs to know about the host name, computed once."""
+    registered_domain: str
+    is_trusted: bool
+    is_suspicious_tld: bool
+    is_ip: bool
+    is_phishy: bool
+    is_shortener: bool
+
+
+def classify_domain(domain: str) -> DomainFlags:
+    extracted = _extract(domain)
+    registered_domain = extracted.registered_domain
+    return DomainFlags(
+        registered_domain=registered_domain,
+        is_trusted=registered_domain in TRUSTED_DOMAINS,
+        is_suspicious_tld=extracted.suffix in SUSPICIOUS_TLDS,
+        is_ip=IP_ADDRESS_PATTERN.match(domain) is not None,
+        is_phishy=any(word in domain for word in PHISHING_WORDS) and not domain.endswith(PHISHING_SAFE_SUFFIXES),
+        is_shortener=registered_domain in URL_SHORTENERS,
+    )
+
+
+@dataclass(slots=True)
+class MainPage:
+    """A site's home page, fetched and parsed once for the privacy and tracking scans."""
+    status: int
+    cookie_count: int
+    # Lowercased (href, text) of each link, external script URLs and inline script bodies
+    links: List[Tuple[str, str]]
+    script_srcs: List[str]
+    inline_scripts: List[str]
+
+
+def parse_page(content: bytes) -> Tuple[List[Tuple[str, str]], List[str], List[str]]:
+    """Extract links and scripts, with selectolax when installed and BeautifulSoup otherwise."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        links = [
+            ((node.attributes.get('href') or '').lower(), node.text().lower())
+            for node in tree.css('a[href]')
+        ]
+        script_srcs = [(node.attributes.get('src') or '').lower() for node in tree.css('script[src]')]
+        inline_scripts = [node.text().lower() for node in tree.css('script:not([src])')]
+        return links, script_srcs, inline_scripts
+    
+    soup = BeautifulSoup(content, 'lxml', parse_only=PAGE_STRAINER)
+    links = [(link.get('href', '').lower(), link.get_text().lower()) for link in soup.find_all('a', href=True)]
+    script_srcs = [script.get('src', '').lower() for script in soup.find_all('script', src=True)]
+    inline_scripts = [script.get_text().lower() for script in soup.find_all('script', src=False)]
+    return links, script_srcs, inline_scripts
 
 
 class SecurityAnalyzer:
     """Advanced security and privacy analyzer for websites."""
     
     def __init__(self):
-        self.ua = UserAgent()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-
-    async def analyze_privacy_policy(self, domain: str) -> Dict[str, Any]:
+        # One User-Agent per process, sent with each request over the shared pool
+        self.headers = {'User-Agent': random.choice(USER_AGENTS)}
+
+    async def fetch_main_page(self, domain: str) -> MainPage:
+        """GET https://{domain} and parse its anchors and scripts."""
+        async with get_session().get(f"https://{domain}", headers=self.headers, timeout=MAIN_PAGE_TIMEOUT) as response:
+            status = response.status
+            cookie_count = len(response.cookies)
+            content = await read_capped(response)
+        
+        if status != 200:
+            return MainPage(status, cookie_count, [], [], [])
+        return MainPage(status, cookie_count, *parse_page(content))
+
+    async def _probe_status(self, url: str) -> Optional[int]:
+        try:
+            async with get_session().head(url, headers=self.headers, timeout=PROBE_TIMEOUT) as response:
+                return response.status
+        except Exception:
+            return None
+    
+    async def _probe_policy_paths(self, base_url: str) -> Optional[str]:
+        """HEAD every common policy path at once and return the first that answers 200."""
+        probes = {
+            asyncio.create_task(self._probe_status(base_url + path)): base_url + path
+            for path in POLICY_PATHS
+        }
+        pending = set(probes)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for probe in done:
+                    if probe.result() == 200:
+                        return probes[probe]
+            return None
+        finally:
+            for probe in pending:
+                probe.cancel()
+    
+    async def analyze_privacy_policy(self, domain: str, main_page: Awaitable[MainPage]) -> Dict[str, Any]:
         """Scrape and analyze privacy policy for data collection practices."""
         privacy_info = {
             "has_privacy_policy": False,
@@ -49,24 +404,14 @@ class SecurityAnalyzer:
         }
         
         try:
-            # Common privacy policy URLs
-            policy_paths = [
-                '/privacy', '/privacy-policy', '/privacy.html', '/privacypolicy',
-                '/legal/privacy', '/terms/privacy', '/privacy-statement'
-            ]
-            
             base_url = f"https://{domain}"
+            session = get_session()
             
             # First, try to find privacy policy link on main page
-            main_response = self.session.get(base_url, timeout=10)
-            if main_response.status_code == 200:
-                soup = BeautifulSoup(main_response.content, 'html.parser')
-                
+            page = await main_page
+            if page.status == 200:
                 # Look for privacy policy links
-                privacy_links = soup.find_all('a', href=True)
-                for link in privacy_links:
-                    href = link.get('href', '').lower()
-                    text = link.get_text().lower()
+                for href, text in page.links:
                     if any(word in href or word in text for word in ['privacy', 'policy', 'data']):
                         if href.startswith('/'):
                             privacy_info["policy_url"] = urljoin(base_url, href)
@@ -76,26 +421,20 @@ class SecurityAnalyzer:
             
             # If not found, try common paths
             if not privacy_info["policy_url"]:
-                for path in policy_paths:
-                    try:
-                        test_url = base_url + path
-                        response = self.session.head(test_url, timeout=5)
-                        if response.status_code == 200:
-                            privacy_info["policy_url"] = test_url
-                            break
-                    except:
-                        continue
+                privacy_info["policy_url"] = await self._probe_policy_paths(base_url)
             
             # Analyze privacy policy content if found
             if privacy_info["policy_url"]:
                 privacy_info["has_privacy_policy"] = True
-                policy_response = self.session.get(privacy_info["policy_url"], timeout=10)
-                if policy_response.status_code == 200:
-                    policy_text = policy_response.text.lower()
+                async with session.get(privacy_info["policy_url"], headers=self.headers, timeout=PAGE_TIMEOUT) as policy_response:
+                    policy_status = policy_response.status
+                    policy_body = await read_capped(policy_response)
+                if policy_status == 200:
+                    practices = POLICY_KEYWORDS.count_bytes(policy_body)
                     
                     # Analyze data collection practices
-                    if any(word in policy_text for word in ['collect', 'gathering', 'obtain', 'receive']):
-                        if any(word in policy_text for word in ['personal', 'pii', 'identifiable']):
+                    if practices['collection']:
+                        if practices['personal']:
                             privacy_info["data_collection"] = "Personal Data Collected"
                         else:
                             privacy_info["data_collection"] = "Data Collected"
@@ -103,19 +442,19 @@ class SecurityAnalyzer:
                         privacy_info["data_collection"] = "Minimal Collection"
                     
                     # Check third-party sharing
-                    if any(word in policy_text for word in ['third party', 'share', 'sell', 'partner']):
+                    if practices['sharing']:
                         privacy_info["third_party_sharing"] = "Shares with Third Parties"
                     else:
                         privacy_info["third_party_sharing"] = "No Third Party Sharing"
                     
                     # Check cookie usage
-                    if any(word in policy_text for word in ['cookie', 'tracking', 'pixel']):
+                    if practices['tracking']:
                         privacy_info["cookie_usage"] = "Uses Cookies/Tracking"
                     else:
                         privacy_info["cookie_usage"] = "No Tracking Mentioned"
                     
                     # Check user rights
-                    if any(word in policy_text for word in ['delete', 'remove', 'opt-out', 'unsubscribe']):
+                    if practices['user_rights']:
                         privacy_info["user_rights"] = "User Control Available"
                     else:
                         privacy_info["user_rights"] = "Limited User Control"
@@ -138,33 +477,14 @@ class SecurityAnalyzer:
         }
         
         try:
-            response = self.session.head(f"https://{domain}", timeout=10)
-            headers = {k.lower(): v for k, v in response.headers.items()}
-            
-            # Check for security headers
-            if 'strict-transport-security' in headers:
-                security_headers["hsts"] = True
-                security_headers["security_score"] += 20
-            
-            if 'x-xss-protection' in headers:
-                security_headers["xss_protection"] = True
-                security_headers["security_score"] += 15
-            
-            if 'x-content-type-options' in headers:
-                security_headers["content_type_options"] = True
-                security_headers["security_score"] += 15
+            async with get_session().head(f"https://{domain}", headers=self.headers, timeout=PAGE_TIMEOUT) as response:
+                headers = response.headers
             
-            if 'x-frame-options' in headers:
-                security_headers["frame_options"] = True
-                security_headers["security_score"] += 15
-            
-            if 'content-security-policy' in headers:
-                security_headers["csp"] = True
-                security_headers["security_score"] += 25
-            
-            if 'referrer-policy' in headers:
-                security_headers["referrer_policy"] = True
-                security_headers["security_score"] += 10
+            # Check for security headers; aiohttp's header mapping is already case-insensitive
+            for header, (flag, score) in SECURITY_HEADERS.items():
+                if header in headers:
+                    security_headers[flag] = True
+                    security_headers["security_score"] += score
         
         except Exception as e:
             security_headers["error"] = str(e)[:100]
@@ -183,52 +503,49 @@ class SecurityAnalyzer:
         }
         
         try:
+            # The four lookups are independent, so they run concurrently
+            spf_records, dmarc_records, mx_records, a_records = await asyncio.gather(
+                _resolver.resolve(domain, 'TXT'),
+                _resolver.resolve(f'_dmarc.{domain}', 'TXT'),
+                _resolver.resolve(domain, 'MX'),
+                _resolver.resolve(domain, 'A'),
+                return_exceptions=True
+            )
+            
             # Check SPF record
-            try:
-                spf_records = dns.resolver.resolve(domain, 'TXT')
+            if not isinstance(spf_records, Exception):
                 for record in spf_records:
                     if 'v=spf1' in str(record):
                         dns_info["spf_record"] = True
                         dns_info["security_score"] += 20
                         break
-            except:
-                pass
             
             # Check DMARC record
-            try:
-                dmarc_records = dns.resolver.resolve(f'_dmarc.{domain}', 'TXT')
+            if not isinstance(dmarc_records, Exception):
                 for record in dmarc_records:
                     if 'v=DMARC1' in str(record):
                         dns_info["dmarc_record"] = True
                         dns_info["security_score"] += 25
                         break
-            except:
-                pass
             
             # Check MX records
-            try:
-                mx_records = dns.resolver.resolve(domain, 'MX')
+            if not isinstance(mx_records, Exception):
                 dns_info["mx_records"] = len(mx_records)
                 if dns_info["mx_records"] > 0:
                     dns_info["security_score"] += 10
-            except:
-                pass
             
             # Check for DNSSEC (simplified check)
-            try:
-                # This is a basic check - full DNSSEC validation is complex
-                dns.resolver.resolve(domain, 'A')
+            # This is a basic check - full DNSSEC validation is complex
+            if not isinstance(a_records, Exception):
                 dns_info["dnssec"] = True  # Assume DNSSEC if DNS resolves properly
                 dns_info["security_score"] += 15
-            except:
-                pass
         
         except Exception as e:
             dns_info["error"] = str(e)[:100]
         
         return dns_info
 
-    async def analyze_cookies_and_tracking(self, domain: str) -> Dict[str, Any]:
+    async def analyze_cookies_and_tracking(self, domain: str, main_page: Awaitable[MainPage]) -> Dict[str, Any]:
         """Analyze cookies and tracking technologies."""
         tracking_info = {
             "total_cookies": 0,
@@ -240,19 +557,15 @@ class SecurityAnalyzer:
         }
         
         try:
-            response = self.session.get(f"https://{domain}", timeout=15)
+            page = await main_page
             
             # Count cookies
-            tracking_info["total_cookies"] = len(response.cookies)
+            tracking_info["total_cookies"] = page.cookie_count
             
             # Analyze page content for tracking
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
+            if page.status == 200:
                 # Look for analytics scripts
-                scripts = soup.find_all('script', src=True)
-                for script in scripts:
-                    src = script.get('src', '').lower()
+                for src in page.script_srcs:
                     if 'google-analytics' in src or 'gtag' in src:
                         tracking_info["analytics_detected"].append("Google Analytics")
                     elif 'facebook' in src and 'pixel' in src:
@@ -263,9 +576,7 @@ class SecurityAnalyzer:
                         tracking_info["analytics_detected"].append("Mixpanel")
                 
                 # Look for inline scripts with tracking
-                inline_scripts = soup.find_all('script', src=False)
-                for script in inline_scripts:
-                    content = script.get_text().lower()
+                for content in page.inline_scripts:
                     if 'gtag' in content or 'ga(' in content:
                         if "Google Analytics" not in tracking_info["analytics_detected"]:
                             tracking_info["analytics_detected"].append("Google Analytics")
@@ -285,32 +596,45 @@ class SecurityAnalyzer:
         return tracking_info
 
 
-async def analyze_url(url: str) -> Dict[str, Any]:
+# Stateless apart from its User-Agent, so one instance serves every analysis
+_analyzer = SecurityAnalyzer()
+
+
+async def analyze_url(url: str) -> UrlResult:
     """Analyze URL for trustworthiness and security indicators using comprehensive scraping."""
     
     parsed = urlparse(url)
     domain = parsed.netloc.lower()
     
-    # Initialize security analyzer
-    analyzer = SecurityAnalyzer()
+    flags = classify_domain(domain)
     
     # Start with higher trust for well-known domains
-    trusted_domains = [
-        'google.com', 'youtube.com', 'facebook.com', 'twitter.com', 'instagram.com',
-        'linkedin.com', 'github.com', 'stackoverflow.com', 'reddit.com', 'wikipedia.org',
-        'amazon.com', 'microsoft.com', 'apple.com', 'netflix.com', 'adobe.com'
-    ]
-    
-    trust = 85 if any(domain.endswith(td) for td in trusted_domains) else 75
+    trust = 85 if flags.is_trusted else 75
     verdict = "Trustworthy"
     
+    # The certificate and WHOIS lookups run alongside the page, header and DNS analyses
+    https_enabled = parsed.scheme == 'https'
+    # Use port 443 for HTTPS
+    port = parsed.port or 443
+    cert_task = asyncio.create_task(_domain_cache.get(
+        (f"{domain}:{port}", 'ssl'), lambda: fetch_certificate(domain, port),
+        cacheable=bool
+    )) if https_enabled else None
+    # WHOIS is keyed by the registered domain, so subdomains share one lookup
+    whois_task = asyncio.create_task(lookup_whois(flags.registered_domain or domain)) if whois else None
+    
     # Perform comprehensive analysis
     try:
-        # Run all analyses concurrently for better performance
-        privacy_task = analyzer.analyze_privacy_policy(domain)
-        security_headers_task = analyzer.analyze_security_headers(domain)
-        dns_security_task = analyzer.analyze_dns_security(domain)
-        tracking_task = analyzer.analyze_cookies_and_tracking(domain)
+        # Run all analyses concurrently for better performance; the privacy and
+        # tracking scans share one fetch and parse of the home page
+        main_page_task = asyncio.create_task(_analyzer.fetch_main_page(domain))
+        privacy_task = _analyzer.analyze_privacy_policy(domain, main_page_task)
+        security_headers_task = _analyzer.analyze_security_headers(domain)
+        dns_security_task = _domain_cache.get(
+            (domain, 'dns'), lambda: _analyzer.analyze_dns_security(domain),
+            cacheable=lambda info: "error" not in info
+        )
+        tracking_task = _analyzer.analyze_cookies_and_tracking(domain, main_page_task)
         
         privacy_info, security_headers, dns_security, tracking_info = await asyncio.gather(
             privacy_task, security_headers_task, dns_security_task, tracking_task,
@@ -350,24 +674,11 @@ async def analyze_url(url: str) -> Dict[str, Any]:
     try:
         # Real WHOIS lookup if available
         if whois:
-            domain_whois = whois.whois(domain)
-            creation_date = domain_whois.creation_date
-            if isinstance(creation_date, list):
-                creation_date = creation_date[0]
-            
-            # Handle timezone-aware datetime comparison
-            if creation_date:
-                if hasattr(creation_date, 'tzinfo') and creation_date.tzinfo is not None:
-                    # Convert timezone-aware datetime to naive UTC
-                    creation_date = creation_date.replace(tzinfo=None)
-                age_days = (datetime.now() - creation_date).days
-            else:
-                age_days = 0
-                
-            registrar = domain_whois.registrar or "Unknown"
+            created_at, registrar = await whois_task
+            age_days = int((time.time() - created_at) // SECONDS_PER_DAY) if created_at else 0
             
             # Age-based trust adjustment (but not for well-known domains)
-            if not any(domain.endswith(td) for td in trusted_domains):
+            if not flags.is_trusted:
                 if age_days < 30:
                     trust -= 30
                     verdict = "Very New Domain"
@@ -378,24 +689,23 @@ async def analyze_url(url: str) -> Dict[str, Any]:
             # Fallback if WHOIS not available
             age_days = 0
             registrar = "WHOIS Unavailable"
-            if not any(domain.endswith(td) for td in trusted_domains):
+            if not flags.is_trusted:
                 trust -= 10
             
     except Exception as e:
         # Fallback if WHOIS fails - but don't penalize known domains heavily
         age_days = 0
         registrar = f"WHOIS Error: {str(e)[:50]}"
-        if not any(domain.endswith(td) for td in trusted_domains):
+        if not flags.is_trusted:
             trust -= 15
     
     # Check for suspicious TLDs
-    suspicious_tlds = ['.tk', '.ml', '.ga', '.cf', '.click', '.download', '.top']
-    if any(domain.endswith(tld) for tld in suspicious_tlds):
+    if flags.is_suspicious_tld:
         trust -= 35
         verdict = "Suspicious TLD"
     
     # Check for IP addresses
-    if re.search(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}', domain):
+    if flags.is_ip:
         trust -= 40
         verdict = "IP Address Used"
     
@@ -403,90 +713,75 @@ async def analyze_url(url: str) -> Dict[str, Any]:
     ssl_valid = False
     ssl_issuer = "N/A"
     cert_expiry = "N/A"
-    https_enabled = parsed.scheme == 'https'
     
     if https_enabled:
         try:
-            context = ssl.create_default_context()
-            # Use port 443 for HTTPS
-            port = parsed.port or 443
-            with socket.create_connection((domain, port), timeout=10) as sock:
-                with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                    cert = ssock.getpeercert()
-                    if cert:
-                        ssl_valid = True
-                        # Extract issuer information safely
-                        issuer_info = cert.get('issuer', [])
-                        if issuer_info:
-                            for item in issuer_info:
-                                if isinstance(item, tuple) and len(item) >= 2:
-                                    if item[0] == 'organizationName':
-                                        ssl_issuer = str(item[1])
-                                        break
-                            if ssl_issuer == "N/A" and issuer_info:
-                                ssl_issuer = "Certificate Authority"
-                        
-                        cert_expiry_raw = cert.get('notAfter')
-                        if cert_expiry_raw:
-                            cert_expiry = str(cert_expiry_raw)
-                        trust += 10
+            cert = await cert_task
+            if cert:
+                ssl_valid = True
+                # Extract issuer information safely
+                issuer_info = cert.get('issuer', [])
+                if issuer_info:
+                    for item in issuer_info:
+                        if isinstance(item, tuple) and len(item) >= 2:
+                            if item[0] == 'organizationName':
+                                ssl_issuer = str(item[1])
+                                break
+                    if ssl_issuer == "N/A" and issuer_info:
+                        ssl_issuer = "Certificate Authority"
+                
+                cert_expiry_raw = cert.get('notAfter')
+                if cert_expiry_raw:
+                    cert_expiry = str(cert_expiry_raw)
+                trust += 10
         except Exception as e:
             ssl_valid = False
             # Don't heavily penalize known domains for SSL issues
-            if not any(domain.endswith(td) for td in trusted_domains):
+            if not flags.is_trusted:
                 trust -= 15
             else:
                 trust -= 5  # Minor penalty for known domains
     else:
         # Heavy penalty for no HTTPS, except for known HTTP-only services
-        if not any(domain.endswith(td) for td in trusted_domains):
+        if not flags.is_trusted:
             trust -= 20
             verdict = "No HTTPS"
     
     # Domain reputation check
-    if any(word in domain for word in ['secure', 'login', 'bank', 'paypal', 'amazon']):
-        if not domain.endswith(('.com', '.org', '.gov', '.edu')):
-            trust -= 40
-            verdict = "Potential Phishing"
+    if flags.is_phishy:
+        trust -= 40
+        verdict = "Potential Phishing"
     
     # Check for URL shorteners
-    shorteners = ['bit.ly', 'tinyurl.com', 't.co', 'goo.gl', 'ow.ly', 'short.link']
-    if any(short in domain for short in shorteners):
+    if flags.is_shortener:
         trust -= 20
         verdict = "URL Shortener"
     
-    domain_info: List[Dict[str, Any]] = [
-        {"name": "Domain", "value": domain},
-        {"name": "Age (days)", "value": age_days},
-        {"name": "Registrar", "value": registrar},
-        {"name": "Protocol", "value": parsed.scheme.upper()},
-        {"name": "Port", "value": parsed.port or (443 if parsed.scheme == 'https' else 80)},
+    domain_info = [
+        InfoItem("Domain", domain),
+        InfoItem("Age (days)", age_days),
+        InfoItem("Registrar", registrar),
+        InfoItem("Protocol", parsed.scheme.upper()),
+        InfoItem("Port", parsed.port or (443 if parsed.scheme == 'https' else 80)),
     ]
     
-    ssl_info: List[Dict[str, str]] = [
-        {"name": "HTTPS", "value": "Yes" if ssl_valid else "No"},
-        {"name": "Certificate Valid", "value": "Yes" if ssl_valid else "No"},
-        {"name": "Issuer", "value": ssl_issuer},
-        {"name": "Expires", "value": cert_expiry},
+    ssl_state = "Yes" if ssl_valid else "No"
+    ssl_info = [
+        InfoItem("HTTPS", ssl_state),
+        InfoItem("Certificate Valid", ssl_state),
+        InfoItem("Issuer", ssl_issuer),
+        InfoItem("Expires", cert_expiry),
     ]
     
     # Real backlink simulation based on domain reputation
     backlink_profile = {"total": 0, "reputable": 0}
     
     # Simulate realistic backlink data for known domains
-    if any(domain.endswith(td) for td in trusted_domains):
-        if 'youtube.com' in domain:
-            backlink_profile = {"total": 50000, "reputable": 45000}
-        elif 'google.com' in domain:
-            backlink_profile = {"total": 75000, "reputable": 70000}
-        elif 'facebook.com' in domain:
-            backlink_profile = {"total": 40000, "reputable": 35000}
-        elif 'github.com' in domain:
-            backlink_profile = {"total": 30000, "reputable": 28000}
-        else:
-            backlink_profile = {"total": 15000, "reputable": 12000}
+    if flags.is_trusted:
+        total, reputable = TRUSTED_BACKLINKS.get(flags.registered_domain, DEFAULT_TRUSTED_BACKLINKS)
+        backlink_profile = {"total": total, "reputable": reputable}
         trust += 5  # Bonus for good backlink profile
-    elif not any(domain.endswith(td) for td in trusted_domains):
+    else:
         # Penalty for unknown domains with no backlinks
         trust -= 10
     
@@ -494,7 +789,7 @@ async def analyze_url(url: str) -> Dict[str, Any]:
     trust = max(0, min(100, trust))
     
     # Override verdict for known trusted domains
-    if any(domain.endswith(td) for td in trusted_domains):
+    if flags.is_trusted:
         if trust >= 80:
             verdict = "Trustworthy"
         elif trust >= 70:
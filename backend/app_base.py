@@ -0,0 +1,591 @@
+"""
+CyberAI Inspector Backend - shared application factory
+Every main*.py entrypoint builds its app with create_app(mode); analyzers are
+imported only by the modes that use them, so the mock server never loads
+OpenCV, NLTK or TextBlob.
+"""
+
+from fastapi import FastAPI, File, UploadFile, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+from pydantic import BaseModel, StringConstraints
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, Awaitable, Callable, Dict, Final, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+MODES = ("mock", "real", "realtime", "working")
+
+# Default localhost origins
+DEFAULT_ORIGINS = (
+    "http://localhost:3000",
+    "http://localhost:3001",
+    "http://localhost:5173",
+    "http://localhost:8080",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:3001",
+    "http://127.0.0.1:5173",
+    "http://127.0.0.1:8080",
+)
+
+# Parsed once at import, plus any custom origins from the environment; a frozenset
+# makes CORSMiddleware's per-request origin check a hash lookup
+ALLOWED_ORIGINS = frozenset(DEFAULT_ORIGINS + tuple(
+    origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "").split(",") if origin.strip()
+))
+# Hosts of the forwarded-port and tunnel services the frontend detects: Codespaces,
+# Gitpod, VS Code port forwarding, ngrok, localhost.run, Cloudflare Tunnel,
+# localtunnel and serveo
+DEV_TUNNEL_DOMAINS = (
+    "app.github.dev",
+    "githubpreview.dev",
+    "gitpod.io",
+    "devtunnels.ms",
+    "ngrok-free.app",
+    "ngrok-free.dev",
+    "ngrok.app",
+    "ngrok.io",
+    "lhr.life",
+    "localhost.run",
+    "trycloudflare.com",
+    "loca.lt",
+    "serveo.net",
+)
+# Development origins: local dev servers plus any subdomain of those services.
+# Starlette compiles this once and fullmatches it against each Origin header.
+DEV_ORIGIN_REGEX = r"https?://(localhost|127\.0\.0\.1|[\w-]+(\.[\w-]+)*\.(%s))(:\d+)?" % "|".join(
+    map(re.escape, DEV_TUNNEL_DOMAINS)
+)
+
+# Title, version and / message per mode
+APP_INFO = {
+    "mock": ("CyberAI Inspector Backend", "1.0.0", "CyberAI Inspector Backend API"),
+    "real": ("CyberAI Inspector API", "2.0.0", "CyberAI Inspector Backend API - Real Analysis"),
+    "realtime": ("CyberAI Inspector API - Real-Time Search", "3.0.0", "CyberAI Inspector Backend API - Real-Time Web Search"),
+    "working": ("CyberAI Inspector API", "2.0.0", "CyberAI Inspector Backend API - Real Analysis"),
+}
+
+HEALTH_PAYLOADS = {
+    "mock": {
+        "status": "healthy",
+        "message": "Backend server is running",
+        "timestamp": "2024-10-24",
+        "cors_origins": "Local and forwarded-port origins allowed in development mode"
+    },
+    "real": {
+        "status": "healthy",
+        "message": "Backend server is running with real analysis",
+        "timestamp": "2024-10-24",
+        "cors_origins": "Local and forwarded-port origins allowed in development mode"
+    },
+    "realtime": {
+        "status": "healthy",
+        "message": "Backend server running with real-time web search analysis",
+        "timestamp": "2024-10-24",
+        "cors_origins": "Local and forwarded-port origins allowed in development mode",
+        "analysis_features": {
+            "image_analysis": "OpenCV + PIL + EXIF extraction",
+            "url_analysis": "Security headers + SSL + WHOIS",
+            "text_analysis": "Real-time web search + fact-checking + sentiment analysis"
+        }
+    },
+    "working": {
+        "status": "healthy",
+        "message": "Backend server is running with real analysis",
+        "timestamp": "2024-10-24",
+        "cors_origins": "Local and forwarded-port origins allowed in development mode",
+        "analysis_features": {
+            "image_analysis": "OpenCV + PIL + EXIF extraction",
+            "url_analysis": "Security headers + SSL + WHOIS",
+            "text_analysis": "VADER sentiment analysis"
+        }
+    },
+}
+
+# The frontend build is immutable between deploys, so its layout and index.html
+# are read once at import instead of stat'ed and reopened per request
+FRONTEND_DIST: Final = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "frontend", "dist")
+
+
+def scan_dir(path: str) -> Dict[str, os.DirEntry]:
+    """A directory's entries by name, or nothing if it does not exist."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+# One scandir answers every existence check on the build's top level
+DIST_ENTRIES: Final = scan_dir(FRONTEND_DIST)
+INDEX_HTML: Optional[bytes] = None
+if "index.html" in DIST_ENTRIES and DIST_ENTRIES["index.html"].is_file():
+    with open(DIST_ENTRIES["index.html"].path, "rb") as index_file:
+        INDEX_HTML = index_file.read()
+
+
+def dumps(value) -> bytes:
+    return orjson.dumps(value) if orjson else json.dumps(value).encode("utf-8")
+
+
+# Pydantic v2 validates these in pydantic_core (Rust); the length caps reject oversized
+# bodies during validation and bound the tokenization cost of a single text request
+MAX_URL_LENGTH = 2048
+MAX_TEXT_LENGTH = 100_000
+
+
+class UrlRequest(BaseModel):
+    url: Annotated[str, StringConstraints(max_length=MAX_URL_LENGTH)]
+
+
+class TextRequest(BaseModel):
+    text: Annotated[str, StringConstraints(max_length=MAX_TEXT_LENGTH)]
+
+
+def list_dist_files() -> Dict[str, Tuple[str, os.stat_result]]:
+    """Every file in the build outside assets/ (served by the mount), by its URL path.
+
+    Each maps to its disk path and stat, so FileResponse needs no stat per request.
+    """
+    files = {}
+    pending = [("", entry) for name, entry in DIST_ENTRIES.items() if name != "assets"]
+    while pending:
+        prefix, entry = pending.pop()
+        url_path = prefix + entry.name
+        if entry.is_dir():
+            pending.extend((url_path + "/", child) for child in scan_dir(entry.path).values())
+        elif entry.is_file():
+            files[url_path] = (entry.path, entry.stat())
+    return files
+
+
+DIST_FILES: Final = list_dist_files()
+# Unknown paths under these belong to the API, not the SPA router
+API_PREFIXES: Final = ("api", "analyze")
+
+
+def index_response() -> Response:
+    # index.html names the current hashed assets, so browsers must revalidate it
+    return Response(INDEX_HTML, media_type="text/html", headers={"Cache-Control": "no-cache"})
+
+
+class HashedAssets(StaticFiles):
+    """Vite puts a content hash in every asset name, so assets can be cached forever."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        # Only found files get here, so 404s stay uncached; Starlette's own
+        # size/mtime ETag still answers conditional requests with a 304
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+# Largest image file accepted; the image route's body limit below adds room for
+# the multipart framing around it, so the two cannot drift apart
+MAX_IMAGE_BYTES = int(os.getenv("MAX_IMAGE_BYTES", str(20 * 1024 * 1024)))
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Largest request body accepted per upload route
+MAX_BODY_BYTES = {
+    "/analyze-image/": MAX_IMAGE_BYTES + MULTIPART_OVERHEAD_BYTES,
+    "/analyze-text/": 1024 * 1024,
+    "/analyze-url/": 64 * 1024,
+}
+
+
+class _BodyTooLarge(HTTPException):
+    # An HTTPException, so FastAPI re-raises it from body parsing (instead of
+    # reporting a 400 parse error) and the exception middleware answers 413
+    def __init__(self):
+        super().__init__(status_code=413, detail="Request body too large")
+
+
+class BodySizeLimit:
+    """Reject oversized request bodies with 413 before a route buffers them.
+
+    A declared Content-Length is checked up front; chunked bodies are counted as
+    they arrive, so neither can make a worker spool more than the route's limit.
+    """
+
+    def __init__(self, app, limits: Dict[str, int] = MAX_BODY_BYTES):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            return await self.app(scope, receive, send)
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if not value.isdigit() or int(value) > limit:
+                    return await self._reject(send)
+                break
+
+        received = 0
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise _BodyTooLarge
+            return message
+
+        async def tracked_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except _BodyTooLarge:
+            # Raised outside a route's body parsing, so nothing turned it into a response
+            if response_started:
+                raise
+            await self._reject(send)
+
+    @staticmethod
+    async def _reject(send):
+        await send({"type": "http.response.start", "status": 413, "headers": [(b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
+
+
+def add_cors(app: FastAPI) -> None:
+    # In production only the exact domains in ALLOWED_ORIGINS are allowed; in
+    # development, those plus any localhost port or forwarded port matching
+    # DEV_ORIGIN_REGEX. The frontend sends no cookies or auth, so credentials are
+    # not allowed for any origin, including other people's tunnels and workspaces.
+    production = os.getenv("ENVIRONMENT") == "production"
+
+    # Explicit methods and headers plus a day-long max_age let browsers cache each
+    # preflight instead of repeating the OPTIONS round-trip before every POST
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,
+        allow_origin_regex=None if production else DEV_ORIGIN_REGEX,
+        allow_credentials=False,
+        allow_methods=["GET", "POST", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization"],
+        max_age=86400,
+    )
+
+
+def add_health(app: FastAPI, payload: Dict[str, Any]) -> None:
+    # Static, so serialized and tagged once; monitors that send If-None-Match get a bodiless 304
+    body = dumps(payload)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=5"}
+
+    @app.get("/health")
+    async def health_check(request: Request):
+        """Health check endpoint for debugging connectivity"""
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+
+def add_mock_routes(app: FastAPI) -> None:
+    # The mock bodies never change, so they are serialized once and sent as raw
+    # bytes; only the URL mock echoes the request, spliced into its template
+    url_placeholder = "\x00url\x00"
+    url_prefix, url_suffix = dumps({
+        "trustScore": 75,
+        "verdict": "Moderately Trustworthy",
+        "domainInfo": [
+            {"name": "Domain", "value": url_placeholder},
+            {"name": "Age", "value": "5 years"},
+            {"name": "Registrar", "value": "GoDaddy"},
+            {"name": "Country", "value": "United States"},
+            {"name": "IP Address", "value": "192.168.1.1"},
+            {"name": "Hosting Provider", "value": "Cloudflare"}
+        ],
+        "sslInfo": [
+            {"name": "Certificate Status", "value": "Valid"},
+            {"name": "Issuer", "value": "Let's Encrypt"},
+            {"name": "Expiry Date", "value": "2025-01-24"},
+            {"name": "Encryption", "value": "TLS 1.3"},
+            {"name": "Certificate Type", "value": "Domain Validated"}
+        ],
+        "backlinkProfile": {
+            "total": 1250,
+            "reputable": 950
+        }
+    }).split(dumps(url_placeholder))
+    text_body = dumps({
+        "trustScore": 80,
+        "verdict": "Generally Reliable",
+        "summary": "This is a test response from the backend server for text analysis",
+        "sentiment": "Neutral",
+        "sources": [
+            {
+                "web": {
+                    "uri": "https://example.com/source1",
+                    "title": "Example Source 1"
+                }
+            },
+            {
+                "web": {
+                    "uri": "https://example.com/source2",
+                    "title": "Example Source 2"
+                }
+            }
+        ]
+    })
+    image_body = dumps({
+        "trustScore": 85,
+        "verdict": "Likely Authentic",
+        "analysis": {
+            "metadata": [
+                {"name": "File Size", "value": "2.4 MB"},
+                {"name": "Dimensions", "value": "1920x1080"},
+                {"name": "Format", "value": "JPEG"},
+                {"name": "Color Space", "value": "sRGB"},
+                {"name": "Camera Make", "value": "Canon"},
+                {"name": "Camera Model", "value": "EOS R5"},
+                {"name": "Date Taken", "value": "2024-10-24 10:30:45"}
+            ],
+            "compression": [
+                {"name": "Quality", "value": "85%"},
+                {"name": "Compression Ratio", "value": "12:1"},
+                {"name": "Algorithm", "value": "JPEG Standard"},
+                {"name": "Lossless", "value": "No"}
+            ],
+            "artifacts": [
+                "Minor JPEG compression artifacts detected",
+                "No digital manipulation signatures found",
+                "Original EXIF data intact",
+                "No suspicious pixel patterns"
+            ]
+        }
+    })
+
+    @app.post("/analyze-url/")
+    async def analyze_url_endpoint(req: UrlRequest):
+        # Mock response matching UrlAnalysisResult interface
+        return Response(url_prefix + dumps(req.url) + url_suffix, media_type="application/json")
+
+    @app.post("/analyze-text/")
+    async def analyze_text_endpoint(req: TextRequest):
+        # Mock response matching TextAnalysisResult interface
+        return Response(text_body, media_type="application/json")
+
+    @app.post("/analyze-image/")
+    async def analyze_image_endpoint():
+        # Mock response matching ImageAnalysisResult interface
+        return Response(image_body, media_type="application/json")
+
+
+def _trust_score(result: Any) -> Any:
+    # The analyzers return result dataclasses; the realtime and working text paths return dicts
+    return result.get("trustScore", "unknown") if isinstance(result, dict) else result.trustScore
+
+
+# Analyses admitted at once per worker; the rest wait their turn, so a burst of
+# uploads cannot pile decoded images and queued pool work into memory
+IMAGE_CONCURRENCY = int(os.getenv("IMAGE_CONCURRENCY", max(2, (os.cpu_count() or 1) // 2)))
+TEXT_CONCURRENCY = int(os.getenv("TEXT_CONCURRENCY", 4))
+
+
+def add_analysis_routes(app: FastAPI, analyze_text: Callable[[str], Awaitable[Any]]) -> None:
+    from analyzers.image_analyzer import ImageTooLarge, analyze_image_stream
+    from analyzers.url_analyzer import analyze_url
+
+    image_slots = asyncio.Semaphore(IMAGE_CONCURRENCY)
+    text_slots = asyncio.Semaphore(TEXT_CONCURRENCY)
+
+    @app.post("/analyze-url/")
+    async def analyze_url_endpoint(req: UrlRequest):
+        """Analyze URL using real security and privacy analysis"""
+        try:
+            logger.debug("Analyzing URL: %s", req.url)
+            result = await analyze_url(req.url)
+            logger.info("analyze_url %s trust=%s", req.url, result.trustScore)
+            return result
+        except Exception as e:
+            logger.exception("URL analysis failed for %s", req.url)
+            raise HTTPException(status_code=500, detail=f"URL analysis failed: {str(e)}")
+
+    @app.post("/analyze-text/")
+    async def analyze_text_endpoint(req: TextRequest):
+        """Analyze text for credibility, bias and sentiment"""
+        try:
+            logger.debug("Analyzing text (%d characters)", len(req.text))
+            async with text_slots:
+                result = await analyze_text(req.text)
+            logger.info("analyze_text chars=%d trust=%s", len(req.text), _trust_score(result))
+            return result
+        except Exception as e:
+            logger.exception("Text analysis failed")
+            raise HTTPException(status_code=500, detail=f"Text analysis failed: {str(e)}")
+
+    @app.post("/analyze-image/")
+    async def analyze_image_endpoint(file: UploadFile = File(...)):
+        """Analyze image using real computer vision and metadata extraction"""
+        try:
+            logger.debug("Analyzing image: %s", file.filename)
+
+            # Analyze using real image processing, reading the spooled upload in the analyzer's pool
+            async with image_slots:
+                result = await analyze_image_stream(file.file, MAX_IMAGE_BYTES, file.filename or "upload.jpg")
+            logger.info("analyze_image %s trust=%s", file.filename, result.trustScore)
+            return result
+        except ImageTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except Exception as e:
+            logger.exception("Image analysis failed for %s", file.filename)
+            raise HTTPException(status_code=500, detail=f"Image analysis failed: {str(e)}")
+
+
+def add_frontend(app: FastAPI) -> None:
+    # Mount static files and serve frontend
+    if not DIST_ENTRIES:
+        return
+
+    # Mount assets
+    # The directory is checked here, so StaticFiles needn't check it again
+    assets = DIST_ENTRIES.get("assets")
+    if assets is not None and assets.is_dir():
+        app.mount("/assets", HashedAssets(directory=assets.path, check_dir=False), name="assets")
+
+    # The catch-all serves every deep link, so the build constants it needs are
+    # bound here and read as closure cells rather than module globals per request
+    api_prefixes = API_PREFIXES
+    get_dist_file = DIST_FILES.get
+    has_index = INDEX_HTML is not None
+
+    # Catch-all for React Router
+    @app.get("/{full_path:path}")
+    async def serve_react_app(full_path: str):
+        # Skip API routes just in case
+        if full_path.startswith(api_prefixes):
+            raise HTTPException(status_code=404, detail="Not Found")
+
+        # Check if file exists in dist
+        dist_file = get_dist_file(full_path)
+        if dist_file is not None:
+            path, stat_result = dist_file
+            return FileResponse(path, stat_result=stat_result)
+
+        # Fallback to index.html
+        if not has_index:
+            raise HTTPException(status_code=404, detail="Not Found")
+        return index_response()
+
+
+def make_analyzer_lifespan(warmup: Optional[Callable[[], Any]] = None):
+    @asynccontextmanager
+    async def analyzer_lifespan(app: FastAPI):
+        # Load lexicons, corpora and matchers in each worker before it takes
+        # traffic, so the first request doesn't pay for them
+        if warmup is not None:
+            await asyncio.to_thread(warmup)
+        
+        # The URL analyzers share one pooled HTTP session and the Azure client keeps its
+        # own session and disk cache; all open lazily on the serving loop and are closed
+        # here so nothing leaks at shutdown or when a worker is recycled
+        yield
+        from analyzers.azure_ai import azure_ai
+        from analyzers.url_analyzer import aclose
+        try:
+            await aclose()
+        finally:
+            await azure_ai.aclose()
+    
+    return analyzer_lifespan
+
+
+def create_app(
+    mode: str,
+    analyze_text: Optional[Callable[[str], Awaitable[Any]]] = None,
+    serve_frontend: bool = False,
+    warmup: Optional[Callable[[], Any]] = None,
+) -> FastAPI:
+    """Build the API for one mode: "mock", "real", "realtime" or "working".
+
+    analyze_text overrides the mode's text analyzer (main_working passes its own);
+    serve_frontend adds the built React app at / with /api for the API banner;
+    warmup runs in a worker thread at startup, before the first request.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}; expected one of {', '.join(MODES)}")
+
+    if mode != "mock" and analyze_text is None:
+        if mode == "realtime":
+            from realtime_analyzer import analyze_text_with_search as analyze_text, warmup
+        else:
+            from analyzers.text_analyzer import analyze_text
+
+    title, version, message = APP_INFO[mode]
+    # orjson's C serializer for every dynamic response when it is installed
+    app = FastAPI(
+        title=title,
+        version=version,
+        default_response_class=ORJSONResponse if orjson else JSONResponse,
+        lifespan=None if mode == "mock" else make_analyzer_lifespan(warmup),
+    )
+    app.add_middleware(BodySizeLimit)
+    add_cors(app)
+
+    root_path = "/api" if serve_frontend else "/"
+
+    @app.get(root_path)
+    async def api_root():
+        return {"message": message, "version": version}
+
+    if serve_frontend:
+        @app.get("/")
+        async def root():
+            # If frontend build exists, serve it
+            if INDEX_HTML is not None:
+                return index_response()
+            return {"message": f"{message} (Frontend not found - verify build)"}
+
+    add_health(app, HEALTH_PAYLOADS[mode])
+
+    if mode == "mock":
+        add_mock_routes(app)
+    else:
+        add_analysis_routes(app, analyze_text)
+
+    if serve_frontend:
+        add_frontend(app)
+
+    return app
+
+
+def run(app: FastAPI, default_log_level: str = "info") -> None:
+    """Serve app with uvicorn on port $PORT (default 8000), logging at $LOG_LEVEL."""
+    import uvicorn
+
+    log_level = os.environ.get("LOG_LEVEL", default_log_level)
+    logging.basicConfig(level=log_level.upper())
+
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 8000)),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Excess connections get a 503 instead of queueing without bound
+        limit_concurrency=int(os.environ.get("LIMIT_CONCURRENCY", 100)),
+        log_level=log_level
+    )
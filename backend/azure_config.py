@@ -13,6 +13,7 @@ Get these from your Azure Portal > Cognitive Services
 """
 
 import os
+import tempfile
 from typing import Optional
 
 class AzureConfig:
@@ -28,6 +29,21 @@ class AzureConfig:
     TEXT_ANALYTICS_ENDPOINT: Optional[str] = os.getenv("AZURE_TEXT_ANALYTICS_ENDPOINT") 
     TEXT_ANALYTICS_KEY: Optional[str] = os.getenv("AZURE_TEXT_ANALYTICS_KEY")
     
+    # Response cache (repeat analyses of identical images/texts skip the Azure call)
+    CACHE_TTL: float = float(os.getenv("AZURE_CACHE_TTL", "3600"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("AZURE_CACHE_MAX_ENTRIES", "1024"))
+    # Directory for the disk-backed result cache (requires diskcache); empty disables it
+    CACHE_DIR: Optional[str] = os.getenv(
+        "AZURE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "cyberai-inspector-azure-cache")
+    )
+    
+    # Client-side request rate limits per service (requests per second, match your pricing tier)
+    CV_RPS: float = float(os.getenv("AZURE_CV_RPS", "10"))
+    CS_RPS: float = float(os.getenv("AZURE_CS_RPS", "10"))
+    TA_RPS: float = float(os.getenv("AZURE_TA_RPS", "10"))
+    # Maximum Azure requests in flight at once, across all services
+    MAX_CONCURRENCY: int = int(os.getenv("AZURE_MAX_CONCURRENCY", "8"))
+    
     @classmethod
     def is_computer_vision_configured(cls) -> bool:
         return bool(cls.COMPUTER_VISION_ENDPOINT and cls.COMPUTER_VISION_KEY)
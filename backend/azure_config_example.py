@@ -12,6 +12,7 @@ STEP 1: Get Azure Credentials
 """
 
 import os
+import tempfile
 from typing import Optional
 
 class AzureConfig:
@@ -29,6 +30,17 @@ class AzureConfig:
     TEXT_ANALYTICS_ENDPOINT = "https://your-text-analytics.cognitiveservices.azure.com/"
     TEXT_ANALYTICS_KEY = "your-text-analytics-api-key-here"
     
+    # Response cache for repeat analyses (seconds / number of results kept)
+    CACHE_TTL = 3600
+    CACHE_MAX_ENTRIES = 1024
+    CACHE_DIR = os.path.join(tempfile.gettempdir(), "cyberai-inspector-azure-cache")  # None disables the disk cache
+    
+    # Requests per second allowed by your pricing tier for each service
+    CV_RPS = 10
+    CS_RPS = 10
+    TA_RPS = 10
+    MAX_CONCURRENCY = 8  # Azure requests in flight at once, across all services
+    
     @classmethod
     def is_computer_vision_configured(cls) -> bool:
         return bool(cls.COMPUTER_VISION_ENDPOINT and cls.COMPUTER_VISION_KEY and 
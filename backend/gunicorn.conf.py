@@ -0,0 +1,53 @@
+"""Gunicorn settings for serving main:app with pre-forked Uvicorn workers.
+
+Each worker is a separate process with its own GIL, so CPU-heavy image and
+text analysis in one request no longer stalls the others.
+"""
+import os
+
+# main.py and the analyzers use top-level imports (app_base, analyzers), so the
+# app is loaded from this directory wherever gunicorn is started
+chdir = os.path.dirname(os.path.abspath(__file__))
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: the cgroup v2 quota when one is set, else its affinity mask.
+
+    os.cpu_count() reports the host's cores, which overstates a container's share.
+    """
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as cpu_max:
+            quota, period = cpu_max.read().split()
+        if quota != "max":
+            return max(1, -(-int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Each worker loads its own copy of the NLP models (sentence-transformers, the
+# transformers pipeline, spaCy) on first use and sizes its analysis thread pools
+# to the CPU count, so the default is one worker per available CPU, capped at
+# MAX_DEFAULT_WORKERS to bound memory. WEB_CONCURRENCY overrides it.
+MAX_DEFAULT_WORKERS = 4
+workers = int(os.environ.get("WEB_CONCURRENCY", min(available_cpus(), MAX_DEFAULT_WORKERS)))
+worker_connections = 1000
+keepalive = 30
+# Analysis can wait on slow third-party sites, WHOIS and Azure
+timeout = 120
+# Recycle each worker after this many requests (staggered by the jitter) so
+# memory growth from long-lived analyzer caches and fragmentation is bounded
+max_requests = 10000
+max_requests_jitter = 1000
+loglevel = os.environ.get("LOG_LEVEL", "warning")
+
+# Import the app (and the analyzer modules' keyword tables and patterns) once
+# in the master; workers share those pages copy-on-write after fork. The models,
+# thread pools and HTTP sessions are not shared: they are created lazily, after
+# fork, in every worker (torch and OpenMP thread pools are not fork-safe).
+preload_app = True
@@ -9,18 +9,84 @@ import re
 from typing import Dict, Any, List, Tuple, Optional
 from textblob import TextBlob
 import requests
-from bs4 import BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup
 from urllib.parse import quote_plus
 import time
+from analyzers.url_analyzer import DomainCache, get_session
+
+SEARCH_URL = "https://html.duckduckgo.com/html/?q="
+# Sponsored results link through DuckDuckGo's ad redirect
+AD_LINK_MARKER = "duckduckgo.com/y.js?"
+SEARCH_TIMEOUT = aiohttp.ClientTimeout(total=10)
+SEARCH_CACHE_TTL = 600
+SEARCH_CACHE_MAX_ENTRIES = 1024
+SEARCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Geographic claim patterns, compiled once. Claims may overlap across patterns, so
+# each keeps its own pass; the prefilter requires the " is " / " belongs " every
+# pattern contains, skipping all four passes on text without one.
+GEOGRAPHIC_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\w+)\s+is\s+a\s+(state|country|city|province)\s+of\s+(\w+)',
+    r'(\w+)\s+is\s+(not\s+)?a\s+(state|country|city|province)',
+    r'(\w+)\s+belongs\s+to\s+(\w+)',
+    r'(\w+)\s+is\s+in\s+(\w+)',
+))
+GEOGRAPHIC_PREFILTER = re.compile(r'\s(?:is|belongs)\s')
+
+
+def parse_search_links(html: bytes, max_results: int) -> List[Tuple[str, str, str]]:
+    """(title, href, snippet) of the first DuckDuckGo results, with selectolax when installed.
+
+    Ads are skipped; each result's snippet comes from the same block as its link.
+    """
+    results = []
+    if LexborHTMLParser is not None:
+        for block in LexborHTMLParser(html).css('div.result__body'):
+            link = block.css_first('a.result__a')
+            href = (link.attributes.get('href') or '') if link is not None else ''
+            if not href or AD_LINK_MARKER in href:
+                continue
+            snippet = block.css_first('.result__snippet')
+            results.append((
+                link.text(separator=' ', strip=True),
+                href,
+                snippet.text(separator=' ', strip=True) if snippet is not None else '',
+            ))
+            if len(results) == max_results:
+                break
+    else:
+        for block in BeautifulSoup(html, 'html.parser').select('div.result__body'):
+            link = block.select_one('a.result__a')
+            href = link.get('href', '') if link is not None else ''
+            if not href or AD_LINK_MARKER in href:
+                continue
+            snippet = block.select_one('.result__snippet')
+            results.append((
+                link.get_text(' ', strip=True),
+                href,
+                snippet.get_text(' ', strip=True) if snippet is not None else '',
+            ))
+            if len(results) == max_results:
+                break
+    return results
+
+
+# Search results by (query, result count); shared by every request in the process
+_search_cache = DomainCache(SEARCH_CACHE_TTL, SEARCH_CACHE_MAX_ENTRIES)
 
 
 class RealTimeFactChecker:
     """Real-time fact checking using web search and multiple sources"""
     
     def __init__(self):
-        self.session = None
         self.search_engines = [
-            "https://duckduckgo.com/html/?q=",
+            SEARCH_URL,
             "https://www.bing.com/search?q=",
         ]
         self.fact_check_sites = [
@@ -32,38 +98,31 @@ class RealTimeFactChecker:
             "bbc.com/reality-check"
         ]
         
-    async def get_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-            )
-        return self.session
-    
     async def search_web(self, query: str, max_results: int = 5) -> List[Dict[str, str]]:
-        """Search the web for information about a query"""
+        """Search the web for information about a query
+
+        Concurrent requests for the same search share one fetch, and results are
+        reused for SEARCH_CACHE_TTL; empty results (including failures) are not kept.
+        """
+        return await _search_cache.get(
+            (query, str(max_results)), lambda: self._fetch_results(query, max_results), cacheable=bool
+        )
+    
+    async def _fetch_results(self, query: str, max_results: int) -> List[Dict[str, str]]:
         try:
-            session = await self.get_session()
-            search_url = f"https://duckduckgo.com/html/?q={quote_plus(query)}"
+            # The HTML-only host directly; duckduckgo.com/html/ answers with a redirect here
+            search_url = f"{SEARCH_URL}{quote_plus(query)}"
             
-            async with session.get(search_url) as response:
+            # Searches ride the analyzers' shared pool, keeping DuckDuckGo connections warm across requests
+            async with get_session().get(search_url, headers=SEARCH_HEADERS, timeout=SEARCH_TIMEOUT) as response:
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
                     results = []
-                    result_links = soup.find_all('a', class_='result__a')[:max_results]
-                    
-                    for link in result_links:
-                        title = link.get_text(strip=True)
-                        url = link.get('href', '')
+                    for title, url, snippet in parse_search_links(await response.read(), max_results):
                         if url and title:
                             results.append({
                                 'title': title,
                                 'url': url,
-                                'snippet': title  # Simplified for now
+                                'snippet': snippet or title
                             })
                     
                     return results
@@ -80,27 +139,25 @@ class RealTimeFactChecker:
         confidence = 0.5  # Start neutral
         
         # Extract potential geographic claims
-        geographic_patterns = [
-            r'(\w+)\s+is\s+a\s+(state|country|city|province)\s+of\s+(\w+)',
-            r'(\w+)\s+is\s+(not\s+)?a\s+(state|country|city|province)',
-            r'(\w+)\s+belongs\s+to\s+(\w+)',
-            r'(\w+)\s+is\s+in\s+(\w+)',
-        ]
-        
+        text_lower = text.lower()
         claims_found = []
-        for pattern in geographic_patterns:
-            matches = re.finditer(pattern, text.lower())
-            for match in matches:
-                claims_found.append(match.group(0))
+        if GEOGRAPHIC_PREFILTER.search(text_lower):
+            for pattern in GEOGRAPHIC_PATTERNS:
+                claims_found.extend(match.group(0) for match in pattern.finditer(text_lower))
         
         if not claims_found:
             return confidence, evidence
         
-        # Search for each claim
-        for claim in claims_found[:3]:  # Limit to 3 searches to avoid overwhelming
+        # Search for each claim concurrently, then weigh the results in claim order
+        claims = claims_found[:3]  # Limit to 3 searches to avoid overwhelming
+        searches = await asyncio.gather(
+            *(self.search_web(f"{claim} geography facts", 3) for claim in claims),
+            return_exceptions=True
+        )
+        for claim, results in zip(claims, searches):
             try:
-                search_query = f"{claim} geography facts"
-                results = await self.search_web(search_query, 3)
+                if isinstance(results, Exception):
+                    raise results
                 
                 if results:
                     evidence.append(f"Searched: '{claim}' - Found {len(results)} sources")
@@ -144,10 +201,15 @@ class RealTimeFactChecker:
             if len(phrase.strip()) > 10
         ][:2]  # Limit to 2 main claims
         
-        for phrase in key_phrases:
+        # Search for each phrase concurrently, then weigh the results in phrase order
+        searches = await asyncio.gather(
+            *(self.search_web(f"site:snopes.com OR site:factcheck.org {phrase}", 2) for phrase in key_phrases),
+            return_exceptions=True
+        )
+        for phrase, results in zip(key_phrases, searches):
             try:
-                search_query = f"site:snopes.com OR site:factcheck.org {phrase}"
-                results = await self.search_web(search_query, 2)
+                if isinstance(results, Exception):
+                    raise results
                 
                 if results:
                     evidence.append(f"Fact-check search for '{phrase[:50]}...' found {len(results)} results")
@@ -170,13 +232,15 @@ class RealTimeFactChecker:
     async def analyze_text_credibility(self, text: str) -> Dict[str, Any]:
         """Comprehensive text credibility analysis with real-time verification"""
         
-        # Basic sentiment analysis
-        blob = TextBlob(text)
-        sentiment = blob.sentiment
-        
-        # Real-time fact checking
-        geo_confidence, geo_evidence = await self.verify_geographic_claim(text)
-        fact_confidence, fact_evidence = await self.check_with_fact_checkers(text)
+        # Real-time fact checking; the geographic and fact-checker searches are
+        # independent, so their round-trips overlap instead of adding up. The
+        # basic sentiment analysis is CPU-bound and runs in a worker thread
+        # meanwhile, keeping the event loop free for other requests.
+        sentiment, (geo_confidence, geo_evidence), (fact_confidence, fact_evidence) = await asyncio.gather(
+            asyncio.to_thread(text_sentiment, text),
+            self.verify_geographic_claim(text),
+            self.check_with_fact_checkers(text),
+        )
         
         # Combine all factors
         sentiment_score = (1 - abs(sentiment.polarity)) * 0.2  # Neutral is better
@@ -240,15 +304,21 @@ class RealTimeFactChecker:
             }
         }
     
-    async def close(self):
-        if self.session:
-            await self.session.close()
+
+def text_sentiment(text: str):
+    """TextBlob polarity and subjectivity of text; synchronous CPU work."""
+    return TextBlob(text).sentiment
 
 
 # Global instance
 fact_checker = RealTimeFactChecker()
 
 
+def warmup():
+    """Load TextBlob's sentiment lexicon, read lazily on first use, ahead of the first request."""
+    text_sentiment("Warmup text to load the sentiment lexicon.")
+
+
 async def analyze_text_with_search(text: str) -> Dict[str, Any]:
     """Main function to analyze text with real-time web search"""
     try:
@@ -256,7 +326,6 @@ async def analyze_text_with_search(text: str) -> Dict[str, Any]:
         return result
     except Exception as e:
         # Fallback to basic analysis if web search fails
-        blob = TextBlob(text)
         return {
             "trustScore": 50,
             "verdict": "Analysis Incomplete - Web search unavailable",